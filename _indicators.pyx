@@ -0,0 +1,39 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+bollinger_volume.py 지표 점화식의 Cython 구현 (numba를 설치할 수 없는 환경용)
+
+빌드: pip install cython && cythonize -i _indicators.pyx
+numba가 설치되어 있으면 numba JIT 버전을, 둘 다 없으면 순수 파이썬 루프를 사용한다.
+연산 순서는 bollinger_volume.py의 _ema_loop/_rsi_loop와 같아 결과가 동일하다.
+"""
+
+
+def ema_loop(const double[:] values, Py_ssize_t period, double multiplier, double[:] out):
+    """EMA 점화식을 out[period-1:]에 기록 (첫 값은 period일 단순평균)"""
+    cdef Py_ssize_t i
+    cdef double total = 0.0
+
+    for i in range(period):
+        total += values[i]
+    out[period - 1] = total / period
+    for i in range(period, values.shape[0]):
+        out[i] = (values[i] - out[i - 1]) * multiplier + out[i - 1]
+
+
+def rsi_loop(const double[:] gains, const double[:] losses, Py_ssize_t period, double[:] out):
+    """Wilder 평활 RSI를 out[1:]에 기록"""
+    cdef Py_ssize_t i
+    cdef double avg_gain = 0.0
+    cdef double avg_loss = 0.0
+
+    for i in range(period):
+        avg_gain += gains[i]
+        avg_loss += losses[i]
+    avg_gain /= period
+    avg_loss /= period
+
+    out[1] = 100.0 if avg_loss == 0 else 100 - (100 / (1 + avg_gain / avg_loss))
+    for i in range(period, gains.shape[0]):
+        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+        out[i - period + 2] = 100.0 if avg_loss == 0 else 100 - (100 / (1 + avg_gain / avg_loss))
@@ -307,28 +307,33 @@ class DataLoader:
         return trading_days
     
     @staticmethod
-    def get_stock_timeseries(trading_days, stock_code):
-        """특정 종목의 시계열 데이터 추출"""
-        timeseries = []
+    def build_timeseries_index(trading_days):
+        """전체 거래일을 한 번 순회해 종목코드별 시계열 데이터 생성 (휴장일 제외)
+        
+        종목마다 모든 거래일의 종목 목록을 선형 탐색하지 않도록 {종목코드: 시계열 리스트}로 모아
+        종목 검색과 백테스팅에서 함께 사용한다.
+        """
+        timeseries_by_code = {}
         
         for date, day_data in trading_days.items():
             if day_data.get('is_holiday'):
                 continue
             
-            stocks = day_data.get('stocks', [])
-            for stock in stocks:
-                if stock['code'] == stock_code:
-                    timeseries.append({
-                        'date': date,
-                        'open': stock['open'],
-                        'high': stock['high'],
-                        'low': stock['low'],
-                        'close': stock['close'],
-                        'volume': stock['volume']
-                    })
-                    break
-        
-        return timeseries
+            seen = set()
+            for stock in day_data.get('stocks', []):
+                if stock['code'] in seen:
+                    continue  # 같은 날 중복 항목은 첫 번째만 사용
+                seen.add(stock['code'])
+                timeseries_by_code.setdefault(stock['code'], []).append({
+                    'date': date,
+                    'open': stock['open'],
+                    'high': stock['high'],
+                    'low': stock['low'],
+                    'close': stock['close'],
+                    'volume': stock['volume']
+                })
+        
+        return timeseries_by_code
 
 
 class StockScreener:
@@ -336,6 +341,8 @@ class StockScreener:
     
     def __init__(self, trading_days, silent=False):
         self.trading_days = trading_days
+        # 종목별 시계열 (종목 검색과 백테스팅에서 재사용하도록 한 번만 생성)
+        self.timeseries_by_code = DataLoader.build_timeseries_index(trading_days)
         self.silent = silent
     
     def find_align_momentum_stocks(self, start_date=None, end_date=None, low_period=12, debug=False):
@@ -369,7 +376,7 @@ class StockScreener:
                 print(f"  진행 중: {idx}/{len(stock_codes)} 종목 분석...")
             
             # 종목 시계열 데이터 가져오기
-            timeseries = DataLoader.get_stock_timeseries(self.trading_days, stock_code)
+            timeseries = self.timeseries_by_code.get(stock_code, [])
             
             if len(timeseries) < 150:  # 120일 + 여유
                 continue
@@ -701,7 +708,7 @@ def save_results(results, start_date, end_date):
     print(f"{'='*60}")
 
 
-def backtest_stocks(results, trading_days, end_date, silent=False):
+def backtest_stocks(results, timeseries_by_code, end_date, silent=False):
     """백테스팅: 익일 시가 매수 후 단계적 손절/익절 확인"""
     if not silent:
         print(f"\n{'='*80}")
@@ -714,7 +721,7 @@ def backtest_stocks(results, trading_days, end_date, silent=False):
         stock_code = stock['code']
         signal_idx = stock['signal_index']
         
-        timeseries = DataLoader.get_stock_timeseries(trading_days, stock_code)
+        timeseries = timeseries_by_code.get(stock_code, [])
         
         if signal_idx + 1 >= len(timeseries):
             continue
@@ -887,7 +894,7 @@ def main():
     
     # 백테스팅 실행
     if args.backtest:
-        backtested_stocks = backtest_stocks(selected_stocks, trading_days, end_date, silent=args.silent)
+        backtested_stocks = backtest_stocks(selected_stocks, screener.timeseries_by_code, end_date, silent=args.silent)
         
         print_final_summary(backtested_stocks, silent=args.silent)
         
@@ -1,9 +1,11 @@
 import requests
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 import time
 from pykrx import stock
 import json
+import csv
 import os
 import warnings
 import argparse
@@ -284,17 +286,20 @@ class BNFStockScreener:
         if len(high_prices) < period + 1:
             return None
         
-        true_ranges = []
-        for i in range(1, len(high_prices)):
-            tr1 = high_prices[i] - low_prices[i]
-            tr2 = abs(high_prices[i] - close_prices[i-1])
-            tr3 = abs(low_prices[i] - close_prices[i-1])
-            true_ranges.append(max(tr1, tr2, tr3))
+        high = np.asarray(high_prices, dtype=np.float64)
+        low = np.asarray(low_prices, dtype=np.float64)
+        close = np.asarray(close_prices, dtype=np.float64)
         
-        if len(true_ranges) < period:
+        true_ranges = np.maximum.reduce([
+            high[1:] - low[1:],
+            np.abs(high[1:] - close[:-1]),
+            np.abs(low[1:] - close[:-1])
+        ])
+        
+        if true_ranges.size < period:
             return None
         
-        atr = sum(true_ranges[-period:]) / period
+        atr = float(true_ranges[-period:].mean())
         return atr
     
     def calculate_support_resistance(self, high_prices, low_prices, close_prices, period=20):
@@ -562,9 +567,11 @@ class BNFStockScreener:
             print(f"\n결과 저장: {filename}")
             
             csv_filename = f"result_{self.last_trading_date}.csv"
-            df = pd.DataFrame(results)
-            df.insert(0, 'trading_date', self.last_trading_date)
-            df.to_csv(csv_filename, index=False, encoding='utf-8-sig')
+            with open(csv_filename, 'w', newline='', encoding='utf-8-sig') as f:
+                writer = csv.DictWriter(f, fieldnames=['trading_date', *results[0].keys()], lineterminator=os.linesep)
+                writer.writeheader()
+                for result in results:
+                    writer.writerow({'trading_date': self.last_trading_date, **result})
             print(f"CSV 저장: {csv_filename}")
             
         except Exception as e:
@@ -1,15 +1,135 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, time as dt_time
 import time
 from pykrx import stock
 import json
+import csv
 import os
 import warnings
 import argparse
 import sys
+import io
+import contextlib
+import glob
+import itertools
+import threading
+import pickle
+import hashlib
+import heapq
+from functools import lru_cache
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 warnings.filterwarnings('ignore')
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+MARKET_OPEN = dt_time(9, 0)
+MARKET_CLOSE = dt_time(15, 30)
+LFILTER_MIN_BARS = 100  # 이보다 짧은 구간은 lfilter 호출 오버헤드보다 스칼라 루프가 빠름
+JSON_DIR = os.path.join('data', 'json')
+CSV_DIR = os.path.join('data', 'csv')
+INDICATOR_CACHE_DIR = os.path.join('data', 'cache')
+WRITE_BUFFER_SIZE = 1 << 20  # 결과/캐시 파일 쓰기 버퍼 (1MB, write 시스템 호출 횟수 절감)
+KIS_MAX_TPS = 15  # 한국투자증권 API 초당 호출 제한(20건)보다 여유 있게 설정
+KRX_MAX_RPS = 20  # pykrx(KRX 스크래핑) 초당 요청 상한 (KRX 권장 30건 이하)
+BAR = '=' * 60  # 콘솔 출력 구분선
+DASH = '-' * 100
+
+
+_krx_rate_lock = threading.Lock()
+_krx_next_call = 0.0
+
+
+def _throttle_krx():
+    """pykrx 요청 간격을 1/KRX_MAX_RPS초 이상으로 유지 (프로세스 내 모든 스레드가 공유)"""
+    global _krx_next_call
+    with _krx_rate_lock:
+        now = time.monotonic()
+        wait = _krx_next_call - now
+        _krx_next_call = max(now, _krx_next_call) + 1 / KRX_MAX_RPS
+    if wait > 0:
+        time.sleep(wait)
+
+
+def _ema_recursive(values, multiplier, seed):
+    """EMA 점화식 ema = (x - ema) * multiplier + ema 를 적용한 배열 반환 (numba 설치 시 JIT 컴파일)"""
+    out = np.empty(values.shape[0])
+    ema = seed
+    for i in range(values.shape[0]):
+        ema = (values[i] - ema) * multiplier + ema
+        out[i] = ema
+    return out
+
+
+def _wilder_recursive(values, period, seed):
+    """Wilder 평활 avg = (avg * (period - 1) + x) / period 를 적용한 배열 반환 (numba 설치 시 JIT 컴파일)"""
+    out = np.empty(values.shape[0])
+    avg = seed
+    for i in range(values.shape[0]):
+        avg = (avg * (period - 1) + values[i]) / period
+        out[i] = avg
+    return out
+
+
+if njit is not None:
+    _ema_recursive = njit(cache=True)(_ema_recursive)
+    _wilder_recursive = njit(cache=True)(_wilder_recursive)
+
+
+_kospi200_cache = {}  # (캐시 파일 경로, 수정 시각) -> 파싱된 캐시 데이터
+
+
+@lru_cache(maxsize=1)
+def _get_lfilter():
+    """scipy.signal.lfilter 지연 로드 (import 비용이 커서 긴 시계열을 처음 계산할 때만 로드, 미설치 시 None)"""
+    try:
+        from scipy.signal import lfilter
+    except ImportError:
+        return None
+    return lfilter
+
+
+@lru_cache(maxsize=4096)
+def _ticker_name(stock_code):
+    """종목명 조회 (pykrx 원격 조회 결과를 프로세스 내에서 재사용, 캐시 미스만 _throttle_krx로 제한)"""
+    _throttle_krx()
+    return stock.get_market_ticker_name(stock_code)
+
+
+@lru_cache(maxsize=4)
+def _load_config_cached(config_path, mtime):
+    """설정 파일 파싱 결과 캐시 (수정 시각이 바뀌면 다시 읽음)"""
+    with open(config_path, 'rb') as f:
+        raw_config = f.read()
+    return orjson.loads(raw_config) if orjson else json.loads(raw_config)
+
+
+def _load_config(config_path):
+    """설정 파일 로드 (같은 프로세스에서 main()을 반복 호출할 때 재파싱하지 않음)"""
+    return dict(_load_config_cached(config_path, os.path.getmtime(config_path)))
+
 
 class KISAPIClient:
     """한국투자증권 API 클라이언트"""
@@ -29,6 +149,10 @@ class KISAPIClient:
             print("💰 실전투자 모드")
 
         self.access_token = None
+        self.session = self._create_session()
+        self._header_cache = {}
+        self._rate_lock = threading.Lock()
+        self._next_call = 0.0
 
         if not app_key or not app_secret or not account_no:
             raise ValueError("APP_KEY, APP_SECRET, ACCOUNT_NO는 필수입니다.")
@@ -48,6 +172,27 @@ class KISAPIClient:
         if not use_pykrx_for_historical:
             self._check_market_status()
 
+    @staticmethod
+    def _create_session():
+        """요청마다 TCP/TLS 연결을 새로 맺지 않도록 연결 풀을 둔 세션 생성"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                              max_retries=Retry(total=2, backoff_factor=0.3))
+        session.mount("https://", adapter)
+        return session
+
+    def __getstate__(self):
+        """프로세스 간 전달 시 세션과 락은 제외 (자식 프로세스에서 새로 생성)"""
+        state = self.__dict__.copy()
+        state.pop('session', None)
+        state.pop('_rate_lock', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.session = self._create_session()
+        self._rate_lock = threading.Lock()
+
     def _get_access_token(self):
         """접근 토큰 발급"""
         url = f"{self.base_url}/oauth2/tokenP"
@@ -59,7 +204,7 @@ class KISAPIClient:
         }
 
         try:
-            res = requests.post(url, headers=headers, json=data)
+            res = self.session.post(url, headers=headers, json=data)
 
             if res.status_code != 200:
                 print(f"\n❌ 토큰 발급 실패 (HTTP {res.status_code})")
@@ -78,6 +223,7 @@ class KISAPIClient:
                 raise Exception("access_token을 받지 못했습니다.")
 
             self.access_token = result['access_token']
+            self._header_cache.clear()
             print(f"✓ Access Token 발급 성공")
 
         except requests.exceptions.RequestException as e:
@@ -98,14 +244,11 @@ class KISAPIClient:
             print("   마지막 거래일 데이터를 사용합니다.\n")
             return False
 
-        market_open = datetime.strptime("09:00", "%H:%M").time()
-        market_close = datetime.strptime("15:30", "%H:%M").time()
-
-        if current_time < market_open:
+        if current_time < MARKET_OPEN:
             print(f"\n⚠️  경고: 현재 시각 {now.strftime('%H:%M')} - 장 시작 전입니다.")
             print("   전일 종가 데이터를 사용합니다.\n")
             return False
-        elif current_time > market_close:
+        elif current_time > MARKET_CLOSE:
             print(f"\n⚠️  경고: 현재 시각 {now.strftime('%H:%M')} - 장 마감 후입니다.")
             print("   금일 종가 데이터를 사용합니다.\n")
             return False
@@ -118,37 +261,42 @@ class KISAPIClient:
         """마지막 거래일 확인"""
         try:
             today = datetime.now()
-            for i in range(10):
-                check_date = (today - timedelta(days=i)).strftime("%Y%m%d")
-                try:
-                    df = stock.get_index_ohlcv(check_date, check_date, "1001")
-                    if not df.empty:
-                        return check_date
-                except:
-                    continue
+            # 최근 10일 구간을 한 번에 조회해 마지막 행의 날짜를 사용
+            start_date = (today - timedelta(days=9)).strftime("%Y%m%d")
+            df = stock.get_index_ohlcv(start_date, today.strftime("%Y%m%d"), "1001")
+            if not df.empty:
+                return df.index[-1].strftime("%Y%m%d")
             return datetime.now().strftime("%Y%m%d")
         except:
             return datetime.now().strftime("%Y%m%d")
 
     def _get_headers(self, tr_id):
-        """API 호출 헤더 생성"""
-        return {
-            "content-type": "application/json; charset=utf-8",
-            "authorization": f"Bearer {self.access_token}",
-            "appkey": self.app_key,
-            "appsecret": self.app_secret,
-            "tr_id": tr_id
-        }
+        """API 호출 헤더 생성 (tr_id별로 한 번만 생성해 재사용, 토큰 재발급 시 초기화)"""
+        headers = self._header_cache.get(tr_id)
+        if headers is None:
+            headers = self._header_cache[tr_id] = {
+                "content-type": "application/json; charset=utf-8",
+                "authorization": f"Bearer {self.access_token}",
+                "appkey": self.app_key,
+                "appsecret": self.app_secret,
+                "tr_id": tr_id
+            }
+        return headers
 
     def get_kospi200_stocks(self, use_cache=True, cache_file="kospi_200_code.json"):
         """KOSPI 200 종목 코드 조회 (캐싱 지원)"""
         if use_cache and os.path.exists(cache_file):
             try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cached_data = json.load(f)
-                    print(f"캐시 파일에서 KOSPI 200 종목 {len(cached_data['stocks'])}개 로드 완료")
-                    print(f"캐시 생성일: {cached_data['created_at']}")
-                    return cached_data['stocks']
+                key = (cache_file, os.path.getmtime(cache_file))
+                cached_data = _kospi200_cache.get(key)
+                if cached_data is None:
+                    with open(cache_file, 'rb') as f:
+                        raw = f.read()
+                    cached_data = orjson.loads(raw) if orjson else json.loads(raw)
+                    _kospi200_cache[key] = cached_data
+                print(f"캐시 파일에서 KOSPI 200 종목 {len(cached_data['stocks'])}개 로드 완료")
+                print(f"캐시 생성일: {cached_data['created_at']}")
+                return cached_data['stocks']
             except Exception as e:
                 print(f"캐시 파일 읽기 실패: {e}")
                 print("새로 종목 코드를 가져옵니다...")
@@ -156,13 +304,11 @@ class KISAPIClient:
         try:
             stock_codes = stock.get_index_portfolio_deposit_file("1028")
 
-            stocks = []
-            for code in stock_codes:
-                name = stock.get_market_ticker_name(code)
-                stocks.append({
-                    'code': code,
-                    'name': name
-                })
+            # 종목명 조회 간격은 _ticker_name의 공유 제한(_throttle_krx)이 맞춘다
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                names = list(executor.map(_ticker_name, stock_codes))
+
+            stocks = [{'code': code, 'name': name} for code, name in zip(stock_codes, names)]
 
             print(f"KOSPI 200 종목 {len(stocks)}개 로드 완료")
 
@@ -183,6 +329,29 @@ class KISAPIClient:
             print(f"KOSPI 200 종목 코드 조회 실패: {e}")
             return []
 
+    def _throttle(self):
+        """호출 간격을 1/KIS_MAX_TPS초 이상으로 유지 (스레드 간 공유)"""
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_call - now
+            self._next_call = max(now, self._next_call) + 1 / KIS_MAX_TPS
+        if wait > 0:
+            time.sleep(wait)
+
+    def fetch_quotes(self, stock_codes, max_workers=8):
+        """여러 종목의 현재가/일별 시세를 스레드 풀로 동시에 조회
+
+        Returns: {종목코드: (현재가 응답, 일별 시세 응답)} (조회 실패 종목은 제외)
+        """
+        def fetch(stock_code):
+            try:
+                return stock_code, (self.get_current_price(stock_code), self.get_daily_price(stock_code))
+            except Exception:
+                return stock_code, None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return {code: data for code, data in executor.map(fetch, stock_codes) if data is not None}
+
     def get_current_price(self, stock_code):
         """현재가 조회"""
         url = f"{self.base_url}/uapi/domestic-stock/v1/quotations/inquire-price"
@@ -191,7 +360,8 @@ class KISAPIClient:
             "fid_input_iscd": stock_code
         }
         headers = self._get_headers("FHKST01010100")
-        res = requests.get(url, headers=headers, params=params)
+        self._throttle()
+        res = self.session.get(url, headers=headers, params=params)
         return res.json()
 
     def get_daily_price(self, stock_code, days=30):
@@ -204,11 +374,13 @@ class KISAPIClient:
             "fid_period_div_code": "D"
         }
         headers = self._get_headers("FHKST01010400")
-        res = requests.get(url, headers=headers, params=params)
+        self._throttle()
+        res = self.session.get(url, headers=headers, params=params)
         return res.json()
 
     def get_historical_data_pykrx(self, stock_code, start_date, end_date):
-        """pykrx를 이용한 과거 데이터 조회"""
+        """pykrx를 이용한 과거 데이터 조회 (요청 간격은 _throttle_krx로 제한)"""
+        _throttle_krx()
         try:
             df = stock.get_market_ohlcv(start_date, end_date, stock_code)
             if df.empty:
@@ -218,6 +390,136 @@ class KISAPIClient:
             return None
 
 
+class HistoricalCache:
+    """기간 분석용 과거 데이터 캐시
+
+    종목별로 전체 분석 기간의 데이터를 한 번만 조회하고, MA25/지지선/저항선을
+    미리 계산해 두어 날짜별 분석 시 구간 슬라이스와 조회만 수행한다.
+    """
+
+    def __init__(self, api_client, start_date, end_date, lookback_days=90):
+        self.api = api_client
+        self.lookback_days = lookback_days
+        self.start_date = (datetime.strptime(start_date, "%Y%m%d") - timedelta(days=lookback_days)).strftime("%Y%m%d")
+        self.end_date = end_date
+        self._frames = {}
+
+    def _load(self, stock_code):
+        """종목 전체 기간 데이터 조회 및 롤링 지표 사전 계산"""
+        if stock_code in self._frames:
+            return self._frames[stock_code]
+
+        df = self.api.get_historical_data_pykrx(stock_code, self.start_date, self.end_date)
+        if df is not None:
+            # KRX 가격은 정수 호가이므로 float32로 손실 없이 저장 (캐시 메모리 절반)
+            df = df.astype({'시가': np.float32, '고가': np.float32, '저가': np.float32, '종가': np.float32})
+            if bn is not None:
+                df['ma25'] = bn.move_mean(df['종가'].to_numpy(np.float64), 25)
+                df['support20'] = bn.move_min(df['저가'].to_numpy(np.float64), 20)
+                df['resistance20'] = bn.move_max(df['고가'].to_numpy(np.float64), 20)
+            else:
+                df['ma25'] = df['종가'].rolling(25).mean()
+                df['support20'] = df['저가'].rolling(20).min()
+                df['resistance20'] = df['고가'].rolling(20).max()
+
+        self._frames[stock_code] = df
+        return df
+
+    def prefetch(self, stock_codes, max_workers=4):
+        """미조회 종목을 스레드 풀로 동시에 조회 (I/O 대기 중첩)
+
+        요청 시작 간격은 워커 수와 관계없이 공유 제한(_throttle_krx)으로 초당 KRX_MAX_RPS건 이하로 유지된다.
+        """
+        pending = [code for code in stock_codes if code not in self._frames]
+        if not pending:
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(self._load, pending))
+
+    def get_window(self, stock_code, end_date):
+        """end_date 기준 lookback_days 구간 데이터 반환"""
+        df = self._load(stock_code)
+        if df is None:
+            return None
+
+        end = pd.Timestamp(end_date)
+        start = end - pd.Timedelta(days=self.lookback_days)
+        return df.loc[start:end]
+
+
+# 종목별 분석 작업 단위 (프로세스 풀로 넘기므로 모듈 레벨 namedtuple로 정의)
+ScreenTask = namedtuple('ScreenTask', [
+    'stock_code', 'stock_name', 'prices', 'high_prices', 'low_prices', 'volumes',
+    'current_price', 'prev_price', 'volume', 'prev_volume', 'precomputed', 'criteria'
+])
+
+
+def _task_ma25(prices, precomputed):
+    """MA25 값 (과거 데이터에서 미리 계산해 둔 값이 있으면 사용, 데이터 부족 시 None)"""
+    if 'ma25' in precomputed:
+        return precomputed['ma25']
+    return BNFStockScreener.calculate_moving_average(prices, 25)
+
+
+class IndicatorCache:
+    """거래일별 기술적 지표 디스크 캐시
+
+    종목의 종가/고가/저가 배열 해시를 키로 RSI/MACD/ATR 계산 결과를 pickle로 저장해 두고,
+    같은 데이터로 다시 실행하면(조건만 바꿔 재실행하는 경우 등) 계산을 생략한다.
+    """
+
+    FIELDS = ('rsi', 'rsi_series', 'rsi_signal_series', 'macd', 'atr')
+
+    def __init__(self, cache_path):
+        self.cache_path = cache_path
+        self._entries = {}
+        self._dirty = False
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'rb') as f:
+                    self._entries = pickle.load(f)
+            except Exception as e:
+                print(f"⚠️ 지표 캐시 로드 실패: {e}")
+
+    @staticmethod
+    def make_key(prices, high_prices, low_prices):
+        """가격 배열 내용 기반 캐시 키"""
+        digest = hashlib.blake2b(digest_size=16)
+        for values in (prices, high_prices, low_prices):
+            digest.update(np.asarray(values, dtype=np.float64).tobytes())
+        return digest.hexdigest()
+
+    def attach(self, tasks):
+        """캐시 적중 종목은 precomputed에 지표를 채우고, 미적중 (키, task) 목록을 반환"""
+        misses = []
+        for task in tasks:
+            key = self.make_key(task.prices, task.high_prices, task.low_prices)
+            entry = self._entries.get(key)
+            if entry is None:
+                misses.append((key, task))
+            else:
+                task.precomputed.update(entry)
+        return misses
+
+    def store(self, misses):
+        """미적중 종목의 지표를 계산해 precomputed와 캐시에 반영한 뒤 파일로 저장"""
+        for key, task in misses:
+            precomputed = task.precomputed
+            indicators = BNFStockScreener.compute_all_indicators(task.prices, task.high_prices, task.low_prices,
+                                                                 include_macd='macd' not in precomputed)
+            for name, value in indicators.items():
+                precomputed.setdefault(name, value)
+            self._entries[key] = {field: precomputed[field] for field in self.FIELDS}
+            self._dirty = True
+
+        if self._dirty:
+            os.makedirs(os.path.dirname(self.cache_path) or '.', exist_ok=True)
+            with open(self.cache_path, 'wb') as f:
+                pickle.dump(self._entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+            self._dirty = False
+
+
 class BNFStockScreener:
     """BNF 매매법 종목 선정 (Screener 3 버전)"""
 
@@ -230,32 +532,35 @@ class BNFStockScreener:
             self.last_trading_date = api_client.get_last_trading_date()
             print(f"📅 기준 거래일: {self.last_trading_date[:4]}-{self.last_trading_date[4:6]}-{self.last_trading_date[6:]}\n")
 
-    def calculate_moving_average(self, prices, period=25):
+    @staticmethod
+    def calculate_moving_average(prices, period=25):
         """이동평균 계산"""
         if len(prices) < period:
             return None
-        return sum(prices[-period:]) / period
+        return float(np.mean(prices[-period:]))
 
-    def calculate_ema(self, prices, period):
+    @staticmethod
+    def calculate_ema(prices, period):
         """지수이동평균 (EMA) 계산"""
         if len(prices) < period:
             return None
 
-        ema_values = []
         multiplier = 2 / (period + 1)
 
-        # 첫 EMA는 SMA로 시작
-        sma = sum(prices[:period]) / period
-        ema_values.append(sma)
+        # 첫 EMA는 SMA로 시작 (np.mean의 pairwise 합산 대신 기존과 같은 왼쪽부터의 순차 합산)
+        ema = sum(np.asarray(prices[:period], dtype=np.float64).tolist()) / period
 
         # 이후 EMA 계산
-        for i in range(period, len(prices)):
-            ema = (prices[i] - ema_values[-1]) * multiplier + ema_values[-1]
-            ema_values.append(ema)
+        if njit is not None and len(prices) > period:
+            return float(_ema_recursive(np.asarray(prices[period:], dtype=np.float64), multiplier, ema)[-1])
+
+        for price in np.asarray(prices[period:], dtype=np.float64).tolist():
+            ema = (price - ema) * multiplier + ema
 
-        return ema_values[-1]
+        return ema
 
-    def calculate_macd(self, prices, fast=12, slow=26, signal=9):
+    @staticmethod
+    def calculate_macd(prices, fast=12, slow=26, signal=9):
         """MACD 계산
         Returns: (MACD Line, Signal Line, Histogram, MACD Series, Signal Series)
         """
@@ -273,62 +578,83 @@ class BNFStockScreener:
 
         return macd_line, signal_line, histogram, macd_series.tolist(), signal_series.tolist()
 
-    def calculate_rsi(self, prices, period=14):
+    @staticmethod
+    def calculate_rsi(prices, period=14):
         """RSI 계산"""
         if len(prices) < period + 1:
             return None
 
-        deltas = [prices[i] - prices[i-1] for i in range(1, len(prices))]
-        gains = [d if d > 0 else 0 for d in deltas]
-        losses = [-d if d < 0 else 0 for d in deltas]
+        return BNFStockScreener._rsi_from_deltas(np.diff(np.asarray(prices, dtype=np.float64)[-(period + 1):]), period)
 
-        avg_gain = sum(gains[-period:]) / period
-        avg_loss = sum(losses[-period:]) / period
+    @staticmethod
+    def _rsi_from_deltas(deltas, period=14):
+        """일간 변화량 배열의 최근 period개로 RSI 계산"""
+        deltas = deltas[-period:]
+        avg_gain = np.clip(deltas, 0, None).mean()
+        avg_loss = np.clip(-deltas, 0, None).mean()
 
         if avg_loss == 0:
             return 100
 
         rs = avg_gain / avg_loss
         rsi = 100 - (100 / (1 + rs))
-        return rsi
+        return float(rsi)
 
-    def calculate_rsi_series(self, prices, period=14):
+    @staticmethod
+    def calculate_rsi_series(prices, period=14):
         """RSI 시계열 계산 (최근 여러 일의 RSI 반환)"""
         if len(prices) < period + 1:
             return None
 
-        deltas = [prices[i] - prices[i-1] for i in range(1, len(prices))]
-        gains = [d if d > 0 else 0 for d in deltas]
-        losses = [-d if d < 0 else 0 for d in deltas]
+        return BNFStockScreener._rsi_series_from_deltas(np.diff(np.asarray(prices, dtype=np.float64)), period)
+
+    @staticmethod
+    def _rsi_series_from_deltas(deltas, period=14):
+        """일간 변화량 배열로 Wilder RSI 시계열 계산"""
+        lfilter = _get_lfilter() if len(deltas) - period >= LFILTER_MIN_BARS else None
+        if lfilter is not None:
+            # Wilder 평활 y[n] = decay * y[n-1] + x[n] / period 을 IIR 필터 한 번으로 계산
+            gains = np.clip(deltas, 0, None)
+            losses = np.clip(-deltas, 0, None)
+            decay = (period - 1) / period
+            avg_gain = sum(gains[:period].tolist()) / period
+            avg_loss = sum(losses[:period].tolist()) / period
+            avg_gains = np.concatenate(([avg_gain], lfilter([1 / period], [1, -decay], gains[period:], zi=[decay * avg_gain])[0]))
+            avg_losses = np.concatenate(([avg_loss], lfilter([1 / period], [1, -decay], losses[period:], zi=[decay * avg_loss])[0]))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return np.where(avg_losses == 0, 100.0, 100 - 100 / (1 + avg_gains / avg_losses)).tolist()
+
+        if njit is not None:
+            gains = np.clip(deltas, 0, None)
+            losses = np.clip(-deltas, 0, None)
+            # 초기 평균은 순수 파이썬 경로와 같은 순차 합산으로 구해 결과를 일치시킴
+            avg_gain = sum(gains[:period].tolist()) / period
+            avg_loss = sum(losses[:period].tolist()) / period
+            avg_gains = np.concatenate(([avg_gain], _wilder_recursive(gains[period:], period, avg_gain)))
+            avg_losses = np.concatenate(([avg_loss], _wilder_recursive(losses[period:], period, avg_loss)))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return np.where(avg_losses == 0, 100.0, 100 - 100 / (1 + avg_gains / avg_losses)).tolist()
+
+        gains = np.clip(deltas, 0, None).tolist()
+        losses = np.clip(-deltas, 0, None).tolist()
 
         rsi_values = []
 
         # 첫 RSI 계산 (SMA 방식)
         avg_gain = sum(gains[:period]) / period
         avg_loss = sum(losses[:period]) / period
+        rsi_values.append(100 if avg_loss == 0 else 100 - (100 / (1 + avg_gain / avg_loss)))
 
-        if avg_loss == 0:
-            rsi = 100
-        else:
-            rs = avg_gain / avg_loss
-            rsi = 100 - (100 / (1 + rs))
-        rsi_values.append(rsi)
-
-        # 이후 RSI 계산 (EMA 방식)
-        for i in range(period, len(gains)):
-            avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-            avg_loss = (avg_loss * (period - 1) + losses[i]) / period
-
-            if avg_loss == 0:
-                rsi = 100
-            else:
-                rs = avg_gain / avg_loss
-                rsi = 100 - (100 / (1 + rs))
-            rsi_values.append(rsi)
+        # 이후 RSI 계산 (Wilder 평활, 점화식이라 스칼라 루프 유지)
+        for gain, loss in zip(gains[period:], losses[period:]):
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+            rsi_values.append(100 if avg_loss == 0 else 100 - (100 / (1 + avg_gain / avg_loss)))
 
         return rsi_values
 
-    def calculate_rsi_signal_series(self, rsi_values, signal_period=9):
+    @staticmethod
+    def calculate_rsi_signal_series(rsi_values, signal_period=9):
         """RSI 시그널(EMA) 시계열 계산"""
         if not rsi_values or len(rsi_values) < signal_period:
             return None
@@ -346,43 +672,81 @@ class BNFStockScreener:
 
         return signal_series
 
-    def calculate_atr(self, high_prices, low_prices, close_prices, period=14):
+    @staticmethod
+    def calculate_atr(high_prices, low_prices, close_prices, period=14):
         """ATR (Average True Range) 계산"""
         if len(high_prices) < period + 1:
             return None
 
-        true_ranges = []
-        for i in range(1, len(high_prices)):
-            tr1 = high_prices[i] - low_prices[i]
-            tr2 = abs(high_prices[i] - close_prices[i-1])
-            tr3 = abs(low_prices[i] - close_prices[i-1])
-            true_ranges.append(max(tr1, tr2, tr3))
+        high = np.asarray(high_prices, dtype=np.float64)
+        low = np.asarray(low_prices, dtype=np.float64)
+        close = np.asarray(close_prices, dtype=np.float64)
+
+        true_ranges = np.maximum.reduce([
+            high[1:] - low[1:],
+            np.abs(high[1:] - close[:-1]),
+            np.abs(low[1:] - close[:-1])
+        ])
 
-        if len(true_ranges) < period:
+        if true_ranges.size < period:
             return None
 
-        atr = sum(true_ranges[-period:]) / period
-        return atr
+        return float(true_ranges[-period:].mean())
 
-    def calculate_support_resistance(self, high_prices, low_prices, close_prices, period=20):
+    @staticmethod
+    def calculate_support_resistance(high_prices, low_prices, close_prices, period=20):
         """지지선과 저항선 계산"""
         if len(high_prices) < period:
             return None, None
 
-        recent_highs = high_prices[-period:]
-        recent_lows = low_prices[-period:]
-
-        resistance = max(recent_highs)
-        support = min(recent_lows)
+        resistance = float(np.max(high_prices[-period:]))
+        support = float(np.min(low_prices[-period:]))
 
         return support, resistance
 
-    def calculate_trading_strategy(self, current_price, prices, high_prices, low_prices,
+    @staticmethod
+    def compute_all_indicators(prices, high_prices, low_prices, include_macd=True):
+        """종목 하나의 기술적 지표를 한 번에 계산
+
+        가격 배열 변환과 일간 변화량(RSI/RSI 시계열 공용)을 한 번만 만들어 공유한다.
+        Returns: ma25, rsi, rsi_series, rsi_signal_series, macd, atr, support, resistance 딕셔너리
+                 (include_macd=False이면 macd 제외)
+        """
+        closes = np.asarray(prices, dtype=np.float64)
+        highs = np.asarray(high_prices, dtype=np.float64)
+        lows = np.asarray(low_prices, dtype=np.float64)
+        deltas = np.diff(closes)
+        enough = len(deltas) >= 14
+
+        rsi_series = BNFStockScreener._rsi_series_from_deltas(deltas, 14) if enough else None
+        support, resistance = BNFStockScreener.calculate_support_resistance(highs, lows, closes, 20)
+        indicators = {
+            'ma25': BNFStockScreener.calculate_moving_average(closes, 25),
+            'rsi': BNFStockScreener._rsi_from_deltas(deltas, 14) if enough else None,
+            'rsi_series': rsi_series,
+            'rsi_signal_series': BNFStockScreener.calculate_rsi_signal_series(rsi_series, signal_period=9) if rsi_series else None,
+            'atr': BNFStockScreener.calculate_atr(highs, lows, closes, 14),
+            'support': support,
+            'resistance': resistance
+        }
+        if include_macd:
+            indicators['macd'] = BNFStockScreener.calculate_macd(closes)
+        return indicators
+
+    @staticmethod
+    def calculate_trading_strategy(current_price, prices, high_prices, low_prices,
                                    ma25, atr, support, resistance):
         """손절가/익절가 전략 계산 (MA25 기준)"""
+        # 손절가 계산: 매수가 대비 -3%
+        stop_loss_price = int(current_price * 0.97)
+
         strategy = {
             'entry_price': current_price,
-            'stop_loss': {},
+            'stop_loss': {
+                'price': stop_loss_price,
+                'pct': -3.0,
+                'reason': '매수가 대비 -3%'
+            },
             'take_profit': [],
             'support_line': support,
             'resistance_line': resistance,
@@ -390,53 +754,48 @@ class BNFStockScreener:
             'ma25': ma25
         }
 
-        # 손절가 계산: 매수가 대비 -3%
-        stop_loss_price = current_price * 0.97
-        stop_loss_pct = -3.0
-
-        strategy['stop_loss'] = {
-            'price': int(stop_loss_price),
-            'pct': round(stop_loss_pct, 2),
-            'reason': '매수가 대비 -3%'
-        }
-
-        # 1차 익절가: MA25 도달 시
         if ma25:
+            # 1차 익절가: MA25 도달 시 / 2차 익절가: MA25에서 +5% 이격
             tp1_price = ma25
-            tp1_pct = ((tp1_price - current_price) / current_price) * 100
-
-            strategy['take_profit'].append({
-                'level': 1,
-                'price': int(tp1_price),
-                'pct': round(tp1_pct, 2),
-                'reason': 'MA25 도달',
-                'action': '50% 부분 익절'
-            })
-
-            # 2차 익절가: MA25에서 +5% 이격
             tp2_price = ma25 * 1.05
-            tp2_pct = ((tp2_price - current_price) / current_price) * 100
-
-            strategy['take_profit'].append({
-                'level': 2,
-                'price': int(tp2_price),
-                'pct': round(tp2_pct, 2),
-                'reason': 'MA25 +5% 이격',
-                'action': '잔량 전량 익절'
-            })
-
-        # 손익비 계산
-        if strategy['stop_loss'] and strategy['take_profit']:
-            risk_amount = current_price - strategy['stop_loss']['price']
-            reward_amount = strategy['take_profit'][0]['price'] - current_price
-            risk_reward_ratio = reward_amount / risk_amount if risk_amount > 0 else 0
-            strategy['risk_reward_ratio'] = round(risk_reward_ratio, 2)
+            tp1_int = int(tp1_price)
+
+            strategy['take_profit'] = [
+                {
+                    'level': 1,
+                    'price': tp1_int,
+                    'pct': round((tp1_price - current_price) / current_price * 100, 2),
+                    'reason': 'MA25 도달',
+                    'action': '50% 부분 익절'
+                },
+                {
+                    'level': 2,
+                    'price': int(tp2_price),
+                    'pct': round((tp2_price - current_price) / current_price * 100, 2),
+                    'reason': 'MA25 +5% 이격',
+                    'action': '잔량 전량 익절'
+                }
+            ]
+
+            # 손익비 계산
+            risk_amount = current_price - stop_loss_price
+            reward_amount = tp1_int - current_price
+            strategy['risk_reward_ratio'] = round(reward_amount / risk_amount if risk_amount > 0 else 0, 2)
 
         return strategy
 
-    def screen_stocks(self, stock_codes, criteria, max_stocks=None, save_progress=True, use_historical=False, historical_data=None):
-        """BNF 기준으로 종목 선정 (Screener 3 버전)"""
+    def screen_stocks(self, stock_codes, criteria, max_stocks=None, save_progress=True, use_historical=False, historical_data=None,
+                      historical_cache=None, workers=None, indicator_cache_dir=None, top_k=None, io_pool=None):
+        """BNF 기준으로 종목 선정 (Screener 3 버전)
+
+        데이터 수집은 스레드 풀로 미리 조회해 두고, 지표 계산/조건 검사는 workers > 1이면
+        ProcessPoolExecutor로 병렬 처리한다. workers=0이면 CPU 코어 수만큼 사용한다.
+        io_pool이 주어지면 결과 파일 저장을 해당 스레드 풀에 넘기고 바로 반환한다.
+        이때 저장 작업의 Future는 self.save_future에 두며, 호출한 쪽에서 결과(출력 메시지)를 확인해 출력한다.
+        """
+        self.save_future = None
         results = []
+        tasks = []
         total = len(stock_codes)
 
         if max_stocks:
@@ -447,9 +806,31 @@ class BNFStockScreener:
         print(f"분석 기준: {self.last_trading_date[:4]}-{self.last_trading_date[4:6]}-{self.last_trading_date[6:]} 거래일 데이터")
         print("-" * 60)
 
-        for idx, stock_info in enumerate(stock_codes, 1):
+        codes = [s['code'] if isinstance(s, dict) else s for s in stock_codes]
+        names = {s['code']: s.get('name') for s in stock_codes if isinstance(s, dict)}
+        uncached = codes if historical_data is None else [code for code in codes if code not in historical_data]
+
+        if use_historical and historical_cache is not None:
+            historical_cache.prefetch(uncached)
+
+        # 종목명이 없는 종목은 미리 병렬 조회해 두고 루프에서는 _ticker_name 캐시만 사용
+        # (요청 간격은 _ticker_name 안의 공유 제한이 맞추므로 워커는 소수로 충분)
+        unnamed = [code for code in uncached if not names.get(code)]
+        if use_historical and unnamed:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                list(executor.map(_ticker_name, unnamed))
+
+        quotes = None
+        if not use_historical:
+            quotes = self.api.fetch_quotes(codes)
+
+        progress = stock_codes
+        if tqdm is not None:
+            progress = tqdm(stock_codes, total=total, desc="진행중", file=sys.stderr, mininterval=1.0)
+
+        for idx, stock_info in enumerate(progress, 1):
             try:
-                if idx % 10 == 0:
+                if tqdm is None and idx % 10 == 0:
                     print(f"진행중: {idx}/{total} ({idx/total*100:.1f}%)")
 
                 if isinstance(stock_info, dict):
@@ -460,6 +841,7 @@ class BNFStockScreener:
                     stock_name = None
 
                 prev_volume = None
+                precomputed = {}
                 if use_historical:
                     if historical_data is not None and stock_code in historical_data:
                         data_entry = historical_data[stock_code]
@@ -467,44 +849,56 @@ class BNFStockScreener:
                         high_prices = data_entry['high_prices']
                         low_prices = data_entry['low_prices']
                         volumes = data_entry['volumes']
-                        stock_name = data_entry.get('name', stock_name) or stock.get_market_ticker_name(stock_code)
+                        stock_name = data_entry.get('name', stock_name) or _ticker_name(stock_code)
                     else:
-                        time.sleep(0.1)
-
                         end_date = self.last_trading_date
-                        start_date = (datetime.strptime(end_date, "%Y%m%d") - timedelta(days=90)).strftime("%Y%m%d")
 
-                        df = self.api.get_historical_data_pykrx(stock_code, start_date, end_date)
+                        if historical_cache is not None:
+                            df = historical_cache.get_window(stock_code, end_date)
+                        else:
+                            time.sleep(0.1)
+                            start_date = (datetime.strptime(end_date, "%Y%m%d") - timedelta(days=90)).strftime("%Y%m%d")
+                            df = self.api.get_historical_data_pykrx(stock_code, start_date, end_date)
+
                         if df is None or df.empty or len(df) < 30:
                             continue
 
-                        prices = [float(p) for p in df['종가'].tolist()]
-                        high_prices = [float(p) for p in df['고가'].tolist()]
-                        low_prices = [float(p) for p in df['저가'].tolist()]
-                        volumes = [int(v) for v in df['거래량'].tolist()]
+                        if 'ma25' in df.columns:
+                            last_row = df.iloc[-1]
+                            precomputed = {
+                                'ma25': float(last_row['ma25']),
+                                'support': float(last_row['support20']),
+                                'resistance': float(last_row['resistance20'])
+                            }
+
+                        prices = df['종가'].to_numpy(np.float64)
+                        high_prices = df['고가'].to_numpy(np.float64)
+                        low_prices = df['저가'].to_numpy(np.float64)
+                        volumes = df['거래량'].to_numpy(np.int64)
 
                         if historical_data is not None:
                             historical_data[stock_code] = {
-                                'prices': prices,
-                                'high_prices': high_prices,
-                                'low_prices': low_prices,
-                                'volumes': volumes,
-                                'name': stock_name or stock.get_market_ticker_name(stock_code)
+                                'prices': prices.tolist(),
+                                'high_prices': high_prices.tolist(),
+                                'low_prices': low_prices.tolist(),
+                                'volumes': volumes.tolist(),
+                                'name': stock_name or _ticker_name(stock_code)
                             }
 
-                    current_price = prices[-1]
-                    prev_price = prices[-2] if len(prices) >= 2 else prices[-1]
-                    volume = volumes[-1]
+                    current_price = float(prices[-1])
+                    prev_price = float(prices[-2]) if len(prices) >= 2 else current_price
+                    volume = int(volumes[-1])
                     if len(volumes) >= 2:
-                        prev_volume = volumes[-2]
+                        prev_volume = int(volumes[-2])
 
                     if not stock_name:
-                        stock_name = stock.get_market_ticker_name(stock_code)
+                        stock_name = _ticker_name(stock_code)
 
                 else:
-                    time.sleep(0.05)
+                    if stock_code not in quotes:
+                        continue
 
-                    current_data = self.api.get_current_price(stock_code)
+                    current_data, daily_data = quotes[stock_code]
                     if 'output' not in current_data:
                         continue
 
@@ -520,287 +914,501 @@ class BNFStockScreener:
                     if current_price == 0 or volume == 0:
                         continue
 
-                    time.sleep(0.05)
-                    daily_data = self.api.get_daily_price(stock_code)
                     if 'output' not in daily_data:
                         continue
 
-                    prices = [float(d['stck_clpr']) for d in daily_data['output']]
-                    high_prices = [float(d['stck_hgpr']) for d in daily_data['output']]
-                    low_prices = [float(d['stck_lwpr']) for d in daily_data['output']]
-                    volumes = [int(d['acml_vol']) for d in daily_data['output']]
+                    # 응답 문자열을 numpy가 직접 숫자 배열로 변환 (pykrx 경로와 같은 배열 형식)
+                    daily_output = daily_data['output']
+                    prices = np.array([d['stck_clpr'] for d in daily_output], dtype=np.float64)
+                    high_prices = np.array([d['stck_hgpr'] for d in daily_output], dtype=np.float64)
+                    low_prices = np.array([d['stck_lwpr'] for d in daily_output], dtype=np.float64)
+                    volumes = np.array([d['acml_vol'] for d in daily_output], dtype=np.int64)
 
                     if len(prices) < 30:
                         continue
 
                     if len(volumes) >= 2:
-                        prev_volume = volumes[-2]
-
-                # 기술적 지표 계산
-                ma25 = self.calculate_moving_average(prices, 25)
-                rsi = self.calculate_rsi(prices, 14) if criteria.get('enable_rsi', True) else None
-                rsi_series = self.calculate_rsi_series(prices, 14) if criteria.get('enable_rsi', True) else None
-                rsi_signal_series = self.calculate_rsi_signal_series(rsi_series, signal_period=9) if (criteria.get('enable_rsi', True) and rsi_series) else None
-                macd_line, signal_line, macd_hist, macd_series, macd_signal_series = self.calculate_macd(prices)
-                atr = self.calculate_atr(high_prices, low_prices, prices, 14)
-                support, resistance = self.calculate_support_resistance(high_prices, low_prices, prices, 20)
-
-                price_change_pct = ((current_price - prev_price) / prev_price) * 100
-
-                avg_volume = sum(volumes[-20:]) / 20 if len(volumes) >= 20 else volumes[0]
-                volume_ratio = volume / avg_volume if avg_volume > 0 else 0
-                volume_increase_pct_val = None
-                if prev_volume and prev_volume > 0:
-                    volume_increase_pct_val = (volume / prev_volume) * 100
-
-                # Screener 3 선정 조건 검사
-                passed = True
-                prev_rsi = None
-                curr_rsi = None
-                prev_rsi_signal = None
-                curr_rsi_signal = None
-                prev_macd = None
-                curr_macd = None
-                prev_macd_signal = None
-                curr_macd_signal = None
-
-                # 1) MA25 이격율 조건
-                if criteria.get('enable_ma25', True):
-                    if ma25:
-                        price_above_ma25_pct = ((current_price - ma25) / ma25) * 100
-                        if price_above_ma25_pct > criteria.get('ma25_deviation_max', -10):
-                            passed = False
-                    else:
-                        passed = False
-                else:
-                    price_above_ma25_pct = ((current_price - ma25) / ma25) * 100 if ma25 else None
-
-                # 2) RSI 과매도 상태에서 매수 신호 (RSI 상승 전환)
-                if criteria.get('enable_rsi', True):
-                    if rsi_series and len(rsi_series) >= 2 and rsi_signal_series and len(rsi_signal_series) >= 2:
-                        rsi_max_threshold = criteria.get('rsi_oversold', 30)
-                        lookback_days = 5
-                        signal_period = 9
-                        golden_cross_found = False
-                        golden_prev_rsi = None
-                        golden_curr_rsi = None
-                        golden_prev_signal = None
-                        golden_curr_signal = None
-
-                        if len(rsi_series) < signal_period + lookback_days:
-                            passed = False
-                        else:
-                            start_idx = max(signal_period - 1, len(rsi_series) - lookback_days)
-                        for idx in range(start_idx, len(rsi_series)):
-                            prev_idx = idx - 1
-                            if prev_idx < 0:
-                                continue
-
-                            prev_signal = rsi_signal_series[prev_idx]
-                            curr_signal = rsi_signal_series[idx]
-
-                            if prev_signal is None or curr_signal is None:
-                                continue
-
-                            prev_rsi_val = rsi_series[prev_idx]
-                            curr_rsi_val = rsi_series[idx]
-
-                            prev_diff = prev_rsi_val - prev_signal
-                            curr_diff = curr_rsi_val - curr_signal
-
-                            if (
-                                curr_rsi_val <= rsi_max_threshold and
-                                curr_rsi_val > prev_rsi_val and
-                                prev_diff <= 0 and
-                                curr_diff > 0
-                            ):
-                                golden_cross_found = True
-                                golden_prev_rsi = prev_rsi_val
-                                golden_curr_rsi = curr_rsi_val
-                                golden_prev_signal = prev_signal
-                                golden_curr_signal = curr_signal
-                                break
-
-                        if not golden_cross_found:
-                            passed = False
-                        else:
-                            prev_rsi = golden_prev_rsi
-                            curr_rsi = golden_curr_rsi
-                            prev_rsi_signal = golden_prev_signal
-                            curr_rsi_signal = golden_curr_signal
-                    else:
-                        passed = False
-
-                # 3) MACD(12,26)가 MACD(9) 시그널을 상향 돌파할 것 (옵션 사용 시)
-                if criteria.get('enable_macd', True):
-                    if macd_series and macd_signal_series and len(macd_series) >= 2 and len(macd_signal_series) >= 2:
-                        prev_macd = macd_series[-2]
-                        curr_macd = macd_series[-1]
-                        prev_macd_signal = macd_signal_series[-2]
-                        curr_macd_signal = macd_signal_series[-1]
+                        prev_volume = int(volumes[-2])
 
-                        prev_macd_diff = prev_macd - prev_macd_signal
-                        curr_macd_diff = curr_macd - curr_macd_signal
+                tasks.append(ScreenTask(stock_code, stock_name, prices, high_prices, low_prices, volumes,
+                                        current_price, prev_price, volume, prev_volume, precomputed, criteria))
 
-                        if not (prev_macd_diff <= 0 and curr_macd_diff > 0):
-                            passed = False
-                    else:
-                        passed = False
+            except Exception as e:
+                continue
 
-                # 4) 거래량 조건 (옵션 사용 시)
-                volume_increase_threshold = criteria.get('volume_increase_pct')
-                if volume_increase_threshold is not None:
-                    if volume_increase_pct_val is None:
-                        passed = False
-                    else:
-                        if volume_increase_pct_val < volume_increase_threshold:
-                            passed = False
-
-                if passed:
-                    trading_strategy = self.calculate_trading_strategy(
-                        current_price, prices, high_prices, low_prices,
-                        ma25, atr, support, resistance
-                    )
-
-                    result = {
-                        'stock_code': stock_code,
-                        'stock_name': stock_name,
-                        'current_price': current_price,
-                        'price_change_pct': round(price_change_pct, 2),
-                        'volume': volume,
-                        'volume_ratio': round(volume_ratio, 2),
-                        'prev_volume': prev_volume,
-                        'volume_increase_pct': round(volume_increase_pct_val, 2) if volume_increase_pct_val is not None else None,
-                        'ma25': round(ma25, 2) if ma25 else None,
-                        'price_above_ma25_pct': round(price_above_ma25_pct, 2) if price_above_ma25_pct is not None else None,
-                        'rsi': round(rsi, 2) if rsi else None,
-                        'prev_rsi': round(prev_rsi, 2) if prev_rsi is not None else None,
-                        'curr_rsi': round(curr_rsi, 2) if curr_rsi is not None else None,
-                        'prev_rsi_signal': round(prev_rsi_signal, 2) if prev_rsi_signal is not None else None,
-                        'curr_rsi_signal': round(curr_rsi_signal, 2) if curr_rsi_signal is not None else None,
-                        'macd': round(macd_line, 2) if macd_line is not None else None,
-                        'macd_signal': round(signal_line, 2) if signal_line is not None else None,
-                        'prev_macd': round(prev_macd, 2) if prev_macd is not None else None,
-                        'curr_macd': round(curr_macd, 2) if curr_macd is not None else None,
-                        'prev_macd_signal': round(prev_macd_signal, 2) if prev_macd_signal is not None else None,
-                        'curr_macd_signal': round(curr_macd_signal, 2) if curr_macd_signal is not None else None,
-                        'macd_hist': round(macd_hist, 2) if macd_hist is not None else None,
-                        'atr': round(atr, 2) if atr else None,
-                        'trading_strategy': trading_strategy
-                    }
-                    results.append(result)
-                    rsi_change = (curr_rsi - prev_rsi) if (curr_rsi is not None and prev_rsi is not None) else 0
-                    volume_log = ""
-                    if volume_increase_pct_val is not None:
-                        volume_log = f", 거래량: {volume_increase_pct_val:.1f}%"
-                    signal_log = ""
-                    if criteria.get('enable_rsi', True) and prev_rsi_signal is not None and curr_rsi_signal is not None:
-                        signal_log = f", RSI 시그널: {prev_rsi_signal:.2f}→{curr_rsi_signal:.2f}"
-                macd_log = ""
-                if criteria.get('enable_macd', True):
-                    if prev_macd is not None and curr_macd is not None and prev_macd_signal is not None and curr_macd_signal is not None:
-                        macd_log = f", MACD: {prev_macd:.2f}→{curr_macd:.2f} / 시그널: {prev_macd_signal:.2f}→{curr_macd_signal:.2f}"
-                    elif macd_line is not None:
-                        macd_log = f", MACD: {macd_line:.2f}"
-                rsi_log = ""
-                if criteria.get('enable_rsi', True) and prev_rsi is not None and curr_rsi is not None:
-                    rsi_log = f", RSI: {prev_rsi:.2f}→{curr_rsi:.2f} (+{rsi_change:.2f})"
-                ma25_text = ""
-                if price_above_ma25_pct is not None:
-                    ma25_text = f"이격율: {price_above_ma25_pct:.2f}%"
-                else:
-                    ma25_text = "이격율: N/A"
-                print(f"✓ 선정: {stock_name} ({stock_code}) - {ma25_text}{rsi_log}{signal_log}{macd_log}{volume_log}")
+        if tasks:
+            mask = self._criteria_mask(tasks, criteria)
+            tasks = [tasks[i] for i in np.flatnonzero(mask)]
+            indicator_cache = misses = None
+            if indicator_cache_dir:
+                indicator_cache = IndicatorCache(os.path.join(indicator_cache_dir, f"indicators_{self.last_trading_date}.pkl"))
+                misses = indicator_cache.attach(tasks)
+            self._batch_macd(tasks)
+            if indicator_cache is not None:
+                indicator_cache.store(misses)
+
+        if workers == 0:
+            workers = os.cpu_count() or 1
+
+        if workers and workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                screened = list(executor.map(_screen_single_safe, tasks, chunksize=16))
+        else:
+            screened = [_screen_single_safe(task) for task in tasks]
 
-            except Exception as e:
+        for item in screened:
+            if item is None:
                 continue
+            result, log = item
+            results.append(result)
+            print(log)
 
         print(f"\n분석 완료! 총 {len(results)}개 종목 선정됨")
 
-        # MA25 이격율 낮은 순으로 정렬 (음수가 클수록 우선)
-        results.sort(key=lambda x: x['price_above_ma25_pct'] if x['price_above_ma25_pct'] is not None else 0, reverse=False)
+        # MA25 이격율 낮은 순으로 정렬 (음수가 클수록 우선), top_k 지정 시 상위 top_k개만 선택
+        def sort_key(result):
+            return result['price_above_ma25_pct'] if result['price_above_ma25_pct'] is not None else 0
+
+        if top_k:
+            results = heapq.nsmallest(top_k, results, key=sort_key)
+        else:
+            results.sort(key=sort_key)
 
         if save_progress and results:
-            self._save_results(results)
+            if io_pool is not None:
+                self.save_future = io_pool.submit(self._save_results, list(results))
+            else:
+                for message in self._save_results(results):
+                    print(message)
 
         return results
 
+    @staticmethod
+    def _criteria_mask(tasks, criteria):
+        """MA25 이격율/거래량 조건을 전체 종목에 대해 한 번에 검사
+
+        RSI/MACD 계산 전에 단순 조건으로 탈락 종목을 걸러내는 사전 필터.
+        Returns: 종목별 통과 여부 bool 배열
+        """
+        current = np.array([task.current_price for task in tasks], dtype=np.float64)
+        volume = np.array([task.volume for task in tasks], dtype=np.float64)
+        prev_volume = np.array([task.prev_volume or 0 for task in tasks], dtype=np.float64)
+        ma25 = np.array([_task_ma25(task.prices, task.precomputed) or 0.0 for task in tasks], dtype=np.float64)
+
+        mask = np.ones(len(tasks), dtype=bool)
+
+        if criteria.get('enable_ma25', True):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                deviation = (current - ma25) / ma25 * 100
+            mask &= (ma25 != 0) & (deviation <= criteria.get('ma25_deviation_max', -10))
+
+        volume_increase_threshold = criteria.get('volume_increase_pct')
+        if volume_increase_threshold is not None:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                volume_increase_pct = volume / prev_volume * 100
+            mask &= (prev_volume > 0) & (volume_increase_pct >= volume_increase_threshold)
+
+        return mask
+
+    @staticmethod
+    def _batch_macd(tasks, fast=12, slow=26, signal=9):
+        """전체 종목 MACD를 (일자 x 종목) 2차원 프레임으로 한 번에 계산
+
+        종목별 데이터 길이가 달라 마지막 거래일 기준으로 오른쪽 정렬하고 앞부분은 NaN으로 채운다.
+        ewm(adjust=False)은 선행 NaN 이후 첫 유효값부터 시작하므로 종목별 계산 결과와 같다.
+        결과는 각 종목의 precomputed['macd']에 calculate_macd와 같은 형식으로 저장한다.
+        """
+        targets = [task for task in tasks if len(task.prices) >= slow + signal and 'macd' not in task.precomputed]
+        if not targets:
+            return
+
+        max_len = max(len(task.prices) for task in targets)
+        closes = np.full((max_len, len(targets)), np.nan)
+        for j, task in enumerate(targets):
+            closes[max_len - len(task.prices):, j] = task.prices
+
+        close_df = pd.DataFrame(closes)
+        macd_df = close_df.ewm(span=fast, adjust=False).mean() - close_df.ewm(span=slow, adjust=False).mean()
+        signal_df = macd_df.ewm(span=signal, adjust=False).mean()
+        macd_values = macd_df.to_numpy()
+        signal_values = signal_df.to_numpy()
+
+        for j, task in enumerate(targets):
+            length = len(task.prices)
+            macd_series = macd_values[-length:, j]
+            signal_series = signal_values[-length:, j]
+            task.precomputed['macd'] = (
+                macd_series[-1],
+                signal_series[-1],
+                macd_series[-1] - signal_series[-1],
+                macd_series.tolist(),
+                signal_series.tolist()
+            )
+
     @staticmethod
     def load_api_cache(cache_path):
-        """저장된 API 데이터를 로드"""
+        """저장된 API 데이터를 로드
+
+        .jsonl 파일은 한 줄에 {"date": 날짜, "payload": 날짜별 데이터} 형식이며,
+        같은 날짜가 여러 번 기록되어 있으면 마지막 줄을 사용한다.
+        """
         if not os.path.exists(cache_path):
             return {}
+        loads = orjson.loads if orjson is not None else json.loads
         try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            if not cache_path.endswith('.jsonl'):
+                with open(cache_path, 'rb') as f:
+                    return loads(f.read())
+
+            cache_data = {}
+            with open(cache_path, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = loads(line)
+                    except ValueError:
+                        # 저장 도중 중단되어 잘린 줄은 건너뜀
+                        continue
+                    cache_data[entry['date']] = entry['payload']
+            return cache_data
         except Exception as e:
             print(f"⚠️ 캐시 로드 실패: {e}. 새로 데이터를 수집합니다.")
             return {}
 
     @staticmethod
-    def save_api_cache(cache_path, cache_data):
-        """API 데이터를 캐시에 저장"""
+    def append_api_cache(cache_file, target_date, date_cache):
+        """날짜별 API 데이터를 JSONL 캐시 파일에 한 줄로 추가 (바이너리 모드 파일 객체)"""
+        entry = {'date': target_date, 'payload': date_cache}
         try:
-            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False)
-            print(f"✓ API 데이터 캐시 저장: {cache_path}")
+            if orjson is not None:
+                cache_file.write(orjson.dumps(entry) + b'\n')
+            else:
+                cache_file.write(json.dumps(entry, ensure_ascii=False).encode('utf-8') + b'\n')
+            cache_file.flush()
         except Exception as e:
-            print(f"⚠️ API 데이터 캐시 저장 실패: {e}")
+            print(f"⚠️ API 데이터 캐시 저장 실패 ({target_date}): {e}")
 
     def _save_results(self, results):
-        """결과를 JSON 파일로 저장"""
+        """결과를 JSON/CSV 파일로 저장
+
+        I/O 스레드에서 실행될 수 있으므로 직접 출력하지 않고 출력할 메시지 리스트를 반환한다.
+        """
+        messages = []
         try:
-            os.makedirs('data/json', exist_ok=True)
-            os.makedirs('data/csv', exist_ok=True)
+            os.makedirs(JSON_DIR, exist_ok=True)
+            os.makedirs(CSV_DIR, exist_ok=True)
 
-            json_filename = f"data/json/result_{self.last_trading_date}.json"
+            json_filename = os.path.join(JSON_DIR, f"result_{self.last_trading_date}.json")
 
-            output_data = {
+            header = {
                 'screener_version': 3,
                 'trading_date': self.last_trading_date,
                 'generated_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                 'total_count': len(results),
                 'criteria': {
                     'description': 'MA25 이격율 -10% 이하, RSI 30 이하 상향 돌파, MACD(12,26) 상향 돌파'
-                },
-                'selected_stocks': []
+                }
             }
 
-            for result in results:
-                stock_info = {
-                    'code': result['stock_code'],
-                    'name': result['stock_name'],
-                    'price': result['current_price'],
-                    'change_pct': result['price_change_pct'],
-                    'volume': result['volume'],
-                    'volume_ratio': result['volume_ratio'],
-                    'ma25': result['ma25'],
-                    'price_above_ma25_pct': result['price_above_ma25_pct'],
-                    'rsi': result['rsi'],
-                    'prev_rsi': result['prev_rsi'],
-                    'curr_rsi': result['curr_rsi'],
-                    'macd': result['macd'],
-                    'macd_signal': result['macd_signal'],
-                    'macd_hist': result['macd_hist'],
-                    'atr': result['atr'],
-                    'trading_strategy': result['trading_strategy']
-                }
-                output_data['selected_stocks'].append(stock_info)
+            # output_data 전체를 메모리에 만들지 않고 종목 단위로 바로 기록
+            with open(json_filename, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+                f.write('{\n')
+                for key, value in header.items():
+                    f.write(f'  {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)},\n')
+                f.write('  "selected_stocks": [')
+
+                for i, result in enumerate(results):
+                    stock_info = {
+                        'code': result['stock_code'],
+                        'name': result['stock_name'],
+                        'price': result['current_price'],
+                        'change_pct': result['price_change_pct'],
+                        'volume': result['volume'],
+                        'volume_ratio': result['volume_ratio'],
+                        'ma25': result['ma25'],
+                        'price_above_ma25_pct': result['price_above_ma25_pct'],
+                        'rsi': result['rsi'],
+                        'prev_rsi': result['prev_rsi'],
+                        'curr_rsi': result['curr_rsi'],
+                        'macd': result['macd'],
+                        'macd_signal': result['macd_signal'],
+                        'macd_hist': result['macd_hist'],
+                        'atr': result['atr'],
+                        'trading_strategy': result['trading_strategy']
+                    }
+                    f.write(',\n    ' if i else '\n    ')
+                    if orjson is not None:
+                        f.write(orjson.dumps(stock_info, option=orjson.OPT_SERIALIZE_NUMPY).decode('utf-8'))
+                    else:
+                        f.write(json.dumps(stock_info, ensure_ascii=False, separators=(',', ':')))
 
-            with open(json_filename, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, ensure_ascii=False, indent=2)
+                f.write('\n  ]\n}\n')
 
-            print(f"\nJSON 저장: {json_filename}")
+            messages.append(f"\nJSON 저장: {json_filename}")
 
-            csv_filename = f"data/csv/result_{self.last_trading_date}.csv"
-            df = pd.DataFrame(results)
-            df.insert(0, 'trading_date', self.last_trading_date)
-            df.to_csv(csv_filename, index=False, encoding='utf-8-sig')
-            print(f"CSV 저장: {csv_filename}")
+            # DataFrame을 만들지 않고 종목 단위로 바로 기록
+            csv_filename = os.path.join(CSV_DIR, f"result_{self.last_trading_date}.csv")
+            with open(csv_filename, 'w', newline='', encoding='utf-8-sig', buffering=WRITE_BUFFER_SIZE) as f:
+                writer = csv.DictWriter(f, fieldnames=['trading_date', *results[0].keys()], lineterminator=os.linesep)
+                writer.writeheader()
+                for result in results:
+                    writer.writerow({'trading_date': self.last_trading_date, **result})
+            messages.append(f"CSV 저장: {csv_filename}")
 
         except Exception as e:
-            print(f"결과 저장 실패: {e}")
+            messages.append(f"결과 저장 실패: {e}")
+
+        return messages
+
+
+def _screen_single_safe(args):
+    """_screen_single 래퍼 (종목별 예외는 탈락 처리)"""
+    try:
+        return _screen_single(args)
+    except Exception:
+        return None
+
+
+def _screen_single(args):
+    """단일 종목 지표 계산 및 Screener 3 선정 조건 검사
+
+    ProcessPoolExecutor에서 호출할 수 있도록 모듈 레벨에 둔다.
+    Returns: 선정 시 (result, 로그 문자열), 탈락 시 None
+    """
+    (stock_code, stock_name, prices, high_prices, low_prices, volumes,
+     current_price, prev_price, volume, prev_volume, precomputed, criteria) = args
+
+    # 1) MA25 이격율 조건 (가장 싼 조건을 먼저 검사해 탈락 종목은 나머지 지표 계산 생략)
+    ma25 = _task_ma25(prices, precomputed)
+    price_above_ma25_pct = ((current_price - ma25) / ma25) * 100 if ma25 else None
+    if criteria.get('enable_ma25', True):
+        if price_above_ma25_pct is None or price_above_ma25_pct > criteria.get('ma25_deviation_max', -10):
+            return None
+
+    # 조건별로 필요한 지표만 계산하고 바로 검사 (탈락 즉시 반환, ATR/지지/저항선은 선정 종목만 계산)
+    prev_rsi = None
+    curr_rsi = None
+    prev_rsi_signal = None
+    curr_rsi_signal = None
+    prev_macd = None
+    curr_macd = None
+    prev_macd_signal = None
+    curr_macd_signal = None
+
+    # 2) RSI 과매도 상태에서 매수 신호 (RSI 상승 전환)
+    rsi = None
+    if criteria.get('enable_rsi', True):
+        if 'rsi_series' in precomputed:
+            rsi, rsi_series, rsi_signal_series = precomputed['rsi'], precomputed['rsi_series'], precomputed['rsi_signal_series']
+        elif len(prices) >= 15:
+            # 일간 변화량을 한 번만 계산해 RSI와 RSI 시계열에 공유
+            deltas = np.diff(np.asarray(prices, dtype=np.float64))
+            rsi = BNFStockScreener._rsi_from_deltas(deltas, 14)
+            rsi_series = BNFStockScreener._rsi_series_from_deltas(deltas, 14)
+            rsi_signal_series = BNFStockScreener.calculate_rsi_signal_series(rsi_series, signal_period=9) if rsi_series else None
+        else:
+            return None
+
+        if not (rsi_series and len(rsi_series) >= 2 and rsi_signal_series and len(rsi_signal_series) >= 2):
+            return None
+
+        rsi_max_threshold = criteria.get('rsi_oversold', 30)
+        lookback_days = 5
+        signal_period = 9
+
+        if len(rsi_series) < signal_period + lookback_days:
+            return None
+
+        golden_cross_found = False
+        start_idx = max(signal_period - 1, len(rsi_series) - lookback_days)
+        for idx in range(start_idx, len(rsi_series)):
+            prev_idx = idx - 1
+            if prev_idx < 0:
+                continue
+
+            prev_signal = rsi_signal_series[prev_idx]
+            curr_signal = rsi_signal_series[idx]
+
+            if prev_signal is None or curr_signal is None:
+                continue
+
+            prev_rsi_val = rsi_series[prev_idx]
+            curr_rsi_val = rsi_series[idx]
+
+            prev_diff = prev_rsi_val - prev_signal
+            curr_diff = curr_rsi_val - curr_signal
+
+            if (
+                curr_rsi_val <= rsi_max_threshold and
+                curr_rsi_val > prev_rsi_val and
+                prev_diff <= 0 and
+                curr_diff > 0
+            ):
+                golden_cross_found = True
+                prev_rsi = prev_rsi_val
+                curr_rsi = curr_rsi_val
+                prev_rsi_signal = prev_signal
+                curr_rsi_signal = curr_signal
+                break
+
+        if not golden_cross_found:
+            return None
+
+    # 3) MACD(12,26)가 MACD(9) 시그널을 상향 돌파할 것 (옵션 사용 시)
+    if 'macd' in precomputed:
+        macd_line, signal_line, macd_hist, macd_series, macd_signal_series = precomputed['macd']
+    else:
+        macd_line, signal_line, macd_hist, macd_series, macd_signal_series = BNFStockScreener.calculate_macd(prices)
+
+    if criteria.get('enable_macd', True):
+        if not (macd_series and macd_signal_series and len(macd_series) >= 2 and len(macd_signal_series) >= 2):
+            return None
+
+        prev_macd = macd_series[-2]
+        curr_macd = macd_series[-1]
+        prev_macd_signal = macd_signal_series[-2]
+        curr_macd_signal = macd_signal_series[-1]
+
+        if not (prev_macd - prev_macd_signal <= 0 and curr_macd - curr_macd_signal > 0):
+            return None
+
+    # 4) 거래량 조건 (옵션 사용 시)
+    volume_increase_pct_val = None
+    if prev_volume and prev_volume > 0:
+        volume_increase_pct_val = (volume / prev_volume) * 100
+
+    volume_increase_threshold = criteria.get('volume_increase_pct')
+    if volume_increase_threshold is not None:
+        if volume_increase_pct_val is None or volume_increase_pct_val < volume_increase_threshold:
+            return None
+
+    # 선정 종목만 매매 전략용 지표 계산
+    atr = precomputed['atr'] if 'atr' in precomputed else BNFStockScreener.calculate_atr(high_prices, low_prices, prices, 14)
+    if 'support' in precomputed:
+        support, resistance = precomputed['support'], precomputed['resistance']
+    else:
+        support, resistance = BNFStockScreener.calculate_support_resistance(high_prices, low_prices, prices, 20)
+
+    price_change_pct = ((current_price - prev_price) / prev_price) * 100
+
+    vol_arr = np.asarray(volumes, dtype=np.int64)
+    avg_volume = float(vol_arr[-20:].mean()) if vol_arr.size >= 20 else int(vol_arr[0])
+    volume_ratio = volume / avg_volume if avg_volume > 0 else 0
+
+    trading_strategy = BNFStockScreener.calculate_trading_strategy(
+        current_price, prices, high_prices, low_prices,
+        ma25, atr, support, resistance
+    )
+
+    result = {
+        'stock_code': stock_code,
+        'stock_name': stock_name,
+        'current_price': current_price,
+        'price_change_pct': round(price_change_pct, 2),
+        'volume': volume,
+        'volume_ratio': round(volume_ratio, 2),
+        'prev_volume': prev_volume,
+        'volume_increase_pct': round(volume_increase_pct_val, 2) if volume_increase_pct_val is not None else None,
+        'ma25': round(ma25, 2) if ma25 else None,
+        'price_above_ma25_pct': round(price_above_ma25_pct, 2) if price_above_ma25_pct is not None else None,
+        'rsi': round(rsi, 2) if rsi else None,
+        'prev_rsi': round(prev_rsi, 2) if prev_rsi is not None else None,
+        'curr_rsi': round(curr_rsi, 2) if curr_rsi is not None else None,
+        'prev_rsi_signal': round(prev_rsi_signal, 2) if prev_rsi_signal is not None else None,
+        'curr_rsi_signal': round(curr_rsi_signal, 2) if curr_rsi_signal is not None else None,
+        'macd': round(macd_line, 2) if macd_line is not None else None,
+        'macd_signal': round(signal_line, 2) if signal_line is not None else None,
+        'prev_macd': round(prev_macd, 2) if prev_macd is not None else None,
+        'curr_macd': round(curr_macd, 2) if curr_macd is not None else None,
+        'prev_macd_signal': round(prev_macd_signal, 2) if prev_macd_signal is not None else None,
+        'curr_macd_signal': round(curr_macd_signal, 2) if curr_macd_signal is not None else None,
+        'macd_hist': round(macd_hist, 2) if macd_hist is not None else None,
+        'atr': round(atr, 2) if atr else None,
+        'trading_strategy': trading_strategy
+    }
+    parts = [f"✓ 선정: {stock_name} ({stock_code}) - "]
+    parts.append(f"이격율: {price_above_ma25_pct:.2f}%" if price_above_ma25_pct is not None else "이격율: N/A")
+    if criteria.get('enable_rsi', True) and prev_rsi is not None and curr_rsi is not None:
+        parts.append(f", RSI: {prev_rsi:.2f}→{curr_rsi:.2f} (+{curr_rsi - prev_rsi:.2f})")
+    if criteria.get('enable_rsi', True) and prev_rsi_signal is not None and curr_rsi_signal is not None:
+        parts.append(f", RSI 시그널: {prev_rsi_signal:.2f}→{curr_rsi_signal:.2f}")
+    if criteria.get('enable_macd', True):
+        if prev_macd is not None and curr_macd is not None and prev_macd_signal is not None and curr_macd_signal is not None:
+            parts.append(f", MACD: {prev_macd:.2f}→{curr_macd:.2f} / 시그널: {prev_macd_signal:.2f}→{curr_macd_signal:.2f}")
+        elif macd_line is not None:
+            parts.append(f", MACD: {macd_line:.2f}")
+    if volume_increase_pct_val is not None:
+        parts.append(f", 거래량: {volume_increase_pct_val:.1f}%")
+    log = ''.join(parts)
+
+    return result, log
+
+
+def _screen_date(api, historical_cache, stock_list, criteria, target_date, date_cache, options):
+    """기간 분석의 단일 날짜 분석 및 상위 5개 종목 출력
+
+    Returns: (선정 종목 리스트, 결과 파일 저장 Future 또는 None)
+    """
+    print(f"\n{BAR}")
+    print(f"분석 날짜: {target_date}")
+    print(BAR)
+
+    screener = BNFStockScreener(api, target_date=target_date)
+
+    selected_stocks = screener.screen_stocks(
+        stock_list,
+        criteria,
+        save_progress=True,
+        use_historical=True,
+        historical_data=date_cache,
+        historical_cache=historical_cache,
+        **options
+    )
+
+    if selected_stocks:
+        print(f"\n{target_date}: {len(selected_stocks)}개 종목 선정")
+        for selected in selected_stocks[:5]:
+            prev_rsi = selected.get('prev_rsi')
+            curr_rsi = selected.get('curr_rsi')
+            rsi_text = ""
+            if criteria.get('enable_rsi', True) and prev_rsi is not None and curr_rsi is not None:
+                rsi_change = curr_rsi - prev_rsi
+                rsi_text = f", RSI {prev_rsi:.2f}→{curr_rsi:.2f} (+{rsi_change:.2f})"
+            print(f"  - {selected['stock_name']} ({selected['stock_code']}): 이격율 {selected['price_above_ma25_pct']:.2f}%{rsi_text}")
+
+    return selected_stocks, screener.save_future
+
+
+def _remove_file(file_path):
+    """파일 삭제 (Returns: (경로, 실패 시 예외 / 성공 시 None))"""
+    try:
+        os.remove(file_path)
+        return file_path, None
+    except Exception as e:
+        return file_path, e
+
+
+_date_worker_state = {}
+
+
+def _init_date_worker(api, historical_cache):
+    """날짜 분석 프로세스 초기화 (API 클라이언트와 과거 데이터 캐시는 프로세스당 한 번만 전달)"""
+    _date_worker_state['api'] = api
+    _date_worker_state['historical_cache'] = historical_cache
+
+
+def _screen_date_worker(args):
+    """_screen_date 프로세스 래퍼 (출력은 모아서 반환해 메인 프로세스가 날짜 순서대로 출력)
+
+    Returns: (선정 종목 리스트, 갱신된 날짜별 API 캐시, 출력 로그)
+    """
+    target_date, stock_list, criteria, date_cache, options = args
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        selected_stocks, _ = _screen_date(_date_worker_state['api'], _date_worker_state['historical_cache'],
+                                          stock_list, criteria, target_date, date_cache, options)
+    return selected_stocks, date_cache, buffer.getvalue()
 
 
 def main():
@@ -845,17 +1453,22 @@ Screener 3 선정 기준:
     parser.add_argument('--no-rsi', action='store_true', help='RSI 조건을 사용하지 않음')
     parser.add_argument('--no-ma25', action='store_true', help='MA25 이격율 조건을 사용하지 않음')
     parser.add_argument('--del-olddata', action='store_true', help='data/json 및 data/csv 기존 파일 삭제 후 시작')
+    parser.add_argument('--workers', type=int, default=1, help='지표 계산 병렬 프로세스 수 (기본값: 1, 순차 처리 / 0: CPU 코어 수)')
+    parser.add_argument('--indicator-cache', action='store_true', help='기술적 지표 계산 결과를 data/cache에 저장하고 재사용')
+    parser.add_argument('--date-workers', type=int, default=1, help='기간 분석 시 날짜별 병렬 프로세스 수 (기본값: 1)')
+    parser.add_argument('--top-k', type=int, default=None, help='이격율 상위 K개 종목만 저장 (기본값: 전체)')
 
     args = parser.parse_args()
 
-    print("=" * 60)
+    print(BAR)
     print("BNF 매매법 종목 선정 프로그램 (Screener 3)")
-    print("=" * 60)
+    print(BAR)
 
     # 날짜 범위 처리
     use_historical = False
     date_list = []
     cache_filename = None
+    legacy_cache_filename = None
 
     if args.from_date:
         use_historical = True
@@ -863,17 +1476,16 @@ Screener 3 선정 기준:
             start = datetime.strptime(args.from_date, "%Y%m%d")
             end = datetime.strptime(args.to_date, "%Y%m%d") if args.to_date else start
 
-            current = start
-            while current <= end:
-                date_list.append(current.strftime("%Y%m%d"))
-                current += timedelta(days=1)
+            days = np.arange(np.datetime64(start.date()), np.datetime64(end.date()) + 1)
+            date_list = [day.replace('-', '') for day in np.datetime_as_string(days, unit='D').tolist()]
 
             print(f"\n📅 분석 기간: {args.from_date} ~ {end.strftime('%Y%m%d')}")
             print(f"   총 {len(date_list)}일 분석 예정\n")
 
             cache_from = args.from_date
             cache_to = args.to_date if args.to_date else args.from_date
-            cache_filename = f"data/api_data_{cache_from}_{cache_to}.json"
+            cache_filename = f"data/api_data_{cache_from}_{cache_to}.jsonl"
+            legacy_cache_filename = f"data/api_data_{cache_from}_{cache_to}.json"
 
         except ValueError:
             print("❌ 날짜 형식이 잘못되었습니다. YYYYMMDD 형식으로 입력해주세요.")
@@ -882,8 +1494,7 @@ Screener 3 선정 기준:
     # 설정 파일 또는 명령줄 인수 처리
     if args.config:
         try:
-            with open(args.config, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            config = _load_config(args.config)
 
             app_key = config.get('app_key')
             app_secret = config.get('app_secret')
@@ -914,23 +1525,25 @@ Screener 3 선정 기준:
             sys.exit(1)
 
     # API 클라이언트 초기화
+    # 캐시 파일 존재 여부는 한 번만 확인해 아래 종목 코드 로딩에서도 재사용
     skip_api_init = False
     if use_historical and cache_filename and not args.refresh and not args.no_cache:
-        if os.path.exists(cache_filename) and os.path.exists('kospi_200_code.json'):
-            skip_api_init = True
+        cache_exists = os.path.exists(cache_filename) or os.path.exists(legacy_cache_filename)
+        kospi_exists = os.path.exists('kospi_200_code.json')
+        skip_api_init = cache_exists and kospi_exists
 
     if args.del_olddata:
-        for folder, pattern in [('data/json', '*.json'), ('data/csv', '*.csv')]:
-            folder_path = os.path.join(folder)
-            if os.path.exists(folder_path):
-                for file_name in os.listdir(folder_path):
-                    if file_name.endswith(('.json', '.csv')):
-                        file_path = os.path.join(folder_path, file_name)
-                        try:
-                            os.remove(file_path)
-                            print(f"🧹 삭제: {file_path}")
-                        except Exception as e:
-                            print(f"⚠️ 삭제 실패: {file_path} -> {e}")
+        old_files = itertools.chain.from_iterable(
+            glob.iglob(os.path.join(folder, pattern))
+            for folder in (JSON_DIR, CSV_DIR) for pattern in ('*.json', '*.csv')
+        )
+        # 파일 삭제는 I/O 대기라 스레드로 동시에 처리
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            for file_path, error in executor.map(_remove_file, old_files):
+                if error is None:
+                    print(f"🧹 삭제: {file_path}")
+                else:
+                    print(f"⚠️ 삭제 실패: {file_path} -> {error}")
 
     try:
         print(f"\n입력받은 값:")
@@ -953,11 +1566,11 @@ Screener 3 선정 기준:
         sys.exit(1)
 
     # 종목 코드 로딩
-    print("=" * 60)
+    print(BAR)
     print("KOSPI 200 종목 코드 로딩 중...")
-    print("=" * 60)
+    print(BAR)
 
-    if skip_api_init and os.path.exists('kospi_200_code.json'):
+    if skip_api_init:
         try:
             with open('kospi_200_code.json', 'r', encoding='utf-8') as f:
                 cache_data = json.load(f)
@@ -980,79 +1593,96 @@ Screener 3 선정 기준:
         'enable_ma25': not args.no_ma25
     }
 
-    print("=" * 60)
-    print("BNF 매매법 기준 (Screener 3):")
+    # 선정 기준 배너는 한 번 구성해 한 번에 출력
+    criteria_lines = [BAR, "BNF 매매법 기준 (Screener 3):"]
     if criteria['enable_ma25']:
-        print(f"  - MA25 이격율: {criteria['ma25_deviation_max']}% 이하")
+        criteria_lines.append(f"  - MA25 이격율: {criteria['ma25_deviation_max']}% 이하")
     if criteria['enable_rsi']:
-        print(f"  - RSI: {criteria['rsi_oversold']} 이하 & RSI14가 RSI9(시그널)을 상향 돌파")
+        criteria_lines.append(f"  - RSI: {criteria['rsi_oversold']} 이하 & RSI14가 RSI9(시그널)을 상향 돌파")
     if criteria['enable_macd']:
-        print(f"  - MACD: MACD(12,26)이 MACD(9) 시그널을 상향 돌파")
+        criteria_lines.append("  - MACD: MACD(12,26)이 MACD(9) 시그널을 상향 돌파")
     if criteria['volume_increase_pct'] is not None:
-        print(f"  - 거래량: 전일 대비 {criteria['volume_increase_pct']}% 이상")
-    print("=" * 60)
+        criteria_lines.append(f"  - 거래량: 전일 대비 {criteria['volume_increase_pct']}% 이상")
+    criteria_lines.append(BAR)
+    print('\n'.join(criteria_lines))
 
     # 날짜별 분석
     if use_historical and date_list:
         all_results = {}
 
         api_cache = {}
-        cache_keys = []
-        if args.to_date:
-            cache_keys = [args.from_date, args.to_date]
-        else:
-            cache_keys = [args.from_date, args.from_date]
-
-        cache_filename = f"data/api_data_{cache_keys[0]}_{cache_keys[1]}.json"
-
         if not args.refresh:
-            api_cache = BNFStockScreener.load_api_cache(cache_filename)
-            if api_cache:
-                print(f"✓ 캐시 파일 '{cache_filename}'에서 데이터 로드 완료")
+            # 이전 형식(.json) 캐시가 있으면 먼저 읽고, 날짜별로 추가 기록된 .jsonl 캐시로 덮어씀
+            for filename in (legacy_cache_filename, cache_filename):
+                loaded = BNFStockScreener.load_api_cache(filename)
+                if loaded:
+                    api_cache.update(loaded)
+                    print(f"✓ 캐시 파일 '{filename}'에서 데이터 로드 완료")
 
         os.makedirs('data', exist_ok=True)
 
+        historical_cache = HistoricalCache(api, date_list[0], date_list[-1])
+        options = {
+            'max_stocks': args.max_stocks,
+            'workers': args.workers,
+            'indicator_cache_dir': INDICATOR_CACHE_DIR if args.indicator_cache else None,
+            'top_k': args.top_k
+        }
         for target_date in date_list:
-            print(f"\n{'='*60}")
-            print(f"분석 날짜: {target_date}")
-            print(f"{'='*60}")
-
-            date_cache = api_cache.get(target_date)
-            if date_cache is None:
-                date_cache = {}
-                api_cache[target_date] = date_cache
-
-            screener = BNFStockScreener(api, target_date=target_date)
-
-            selected_stocks = screener.screen_stocks(
-                kospi200_stocks,
-                criteria,
-                max_stocks=args.max_stocks,
-                save_progress=True,
-                use_historical=True,
-                historical_data=date_cache
-            )
-
-            all_results[target_date] = selected_stocks
-
-            if selected_stocks:
-                print(f"\n{target_date}: {len(selected_stocks)}개 종목 선정")
-                for stock in selected_stocks[:5]:
-                    prev_rsi = stock.get('prev_rsi')
-                    curr_rsi = stock.get('curr_rsi')
-                    rsi_text = ""
-                    if criteria.get('enable_rsi', True) and prev_rsi is not None and curr_rsi is not None:
-                        rsi_change = curr_rsi - prev_rsi
-                        rsi_text = f", RSI {prev_rsi:.2f}→{curr_rsi:.2f} (+{rsi_change:.2f})"
-                    print(f"  - {stock['stock_name']} ({stock['stock_code']}): 이격율 {stock['price_above_ma25_pct']:.2f}%{rsi_text}")
-
-        if api_cache:
-            BNFStockScreener.save_api_cache(cache_filename, api_cache)
+            api_cache.setdefault(target_date, {})
+        cached_counts = {target_date: len(api_cache[target_date]) for target_date in date_list}
+
+        # 날짜 분석이 끝날 때마다 새로 수집한 데이터를 캐시 파일에 한 줄씩 추가 (중단되어도 완료된 날짜는 보존)
+        appended_dates = []
+        with open(cache_filename, 'wb' if args.refresh else 'ab') as cache_file:
+            def persist(target_date):
+                if len(api_cache[target_date]) != cached_counts[target_date]:
+                    BNFStockScreener.append_api_cache(cache_file, target_date, api_cache[target_date])
+                    appended_dates.append(target_date)
+
+            if args.date_workers > 1 and len(date_list) > 1:
+                # 날짜별 분석을 프로세스로 분산 (과거 데이터는 미리 한 번 조회해 각 프로세스에 전달)
+                codes = [s['code'] if isinstance(s, dict) else s for s in kospi200_stocks[:args.max_stocks or None]]
+                historical_cache.prefetch([code for code in codes if any(code not in api_cache[d] for d in date_list)])
+                options['workers'] = 1
+
+                tasks = [(target_date, kospi200_stocks, criteria, api_cache[target_date], options) for target_date in date_list]
+                with ProcessPoolExecutor(max_workers=args.date_workers, initializer=_init_date_worker,
+                                         initargs=(api, historical_cache)) as executor:
+                    for target_date, (selected_stocks, date_cache, log) in zip(date_list, executor.map(_screen_date_worker, tasks)):
+                        print(log, end='')
+                        api_cache[target_date] = date_cache
+                        all_results[target_date] = selected_stocks
+                        persist(target_date)
+            else:
+                # 결과 파일 저장은 단일 I/O 스레드에 넘겨 다음 날짜 분석과 겹쳐 실행
+                # (저장 중에 분석한 날짜의 출력은 모아 두었다가, 이전 저장 메시지를 먼저 출력한 뒤 내보내 날짜 순서를 유지)
+                def report_save(future):
+                    if future is not None:
+                        for message in future.result():
+                            print(message)
+
+                save_future = None
+                with ThreadPoolExecutor(max_workers=1) as io_pool:
+                    options['io_pool'] = io_pool
+                    for target_date in date_list:
+                        buffer = io.StringIO()
+                        with contextlib.redirect_stdout(buffer) if save_future is not None else contextlib.nullcontext():
+                            all_results[target_date], next_future = _screen_date(api, historical_cache, kospi200_stocks, criteria,
+                                                                                 target_date, api_cache[target_date], options)
+                        report_save(save_future)
+                        print(buffer.getvalue(), end='')
+                        save_future = next_future
+                        persist(target_date)
+                    report_save(save_future)
+
+        if appended_dates:
+            print(f"✓ API 데이터 캐시 저장: {cache_filename} ({len(appended_dates)}일)")
 
         # 전체 요약
-        print("\n" + "=" * 60)
+        print("\n" + BAR)
         print("전체 분석 결과 요약")
-        print("=" * 60)
+        print(BAR)
         for date, stocks in all_results.items():
             print(f"{date}: {len(stocks)}개 종목")
 
@@ -1065,62 +1695,74 @@ Screener 3 선정 기준:
             criteria,
             max_stocks=args.max_stocks,
             save_progress=True,
-            use_historical=False
+            use_historical=False,
+            workers=args.workers,
+            indicator_cache_dir=INDICATOR_CACHE_DIR if args.indicator_cache else None,
+            top_k=args.top_k
         )
 
-        print("\n" + "=" * 60)
+        print("\n" + BAR)
         print(f"BNF 매매법 선정 종목 (Screener 3): {len(selected_stocks)}개")
-        print("=" * 60 + "\n")
+        print(BAR + "\n")
 
         if selected_stocks:
-            df = pd.DataFrame(selected_stocks)
-
             print("[ TOP 20 종목 ]")
             print("\n종목 기본 정보:")
             basic_cols = ['stock_code', 'stock_name', 'current_price', 'price_above_ma25_pct', 'prev_rsi', 'curr_rsi', 'macd', 'volume_ratio']
-            print(df[basic_cols].head(20).to_string(index=False))
+            # 출력할 상위 20개 종목의 필요한 컬럼만으로 DataFrame 구성 (통계는 아래에서 numpy로 계산)
+            df_head = pd.DataFrame(selected_stocks[:20], columns=basic_cols)
+            print(df_head.to_string(index=False))
 
             print("\n\n매매 전략 (손절/익절):")
-            print("-" * 100)
+            print(DASH)
+            enable_rsi = criteria.get('enable_rsi', True)
+            # 종목별 출력은 모아서 한 번에 기록
+            out = []
             for idx, stock in enumerate(selected_stocks[:20], 1):
                 strategy = stock['trading_strategy']
-                prev_rsi = stock.get('prev_rsi')
-                curr_rsi = stock.get('curr_rsi')
-                rsi_change = (curr_rsi - prev_rsi) if (prev_rsi is not None and curr_rsi is not None) else None
-                print(f"\n{idx}. {stock['stock_name']} ({stock['stock_code']}) - 현재가: {int(stock['current_price']):,}원")
+                prev_rsi, curr_rsi, macd_value, ma25_pct = (stock.get(key) for key in ('prev_rsi', 'curr_rsi', 'macd', 'price_above_ma25_pct'))
+                out.append(f"\n{idx}. {stock['stock_name']} ({stock['stock_code']}) - 현재가: {int(stock['current_price']):,}원")
                 rsi_info = ""
-                if criteria.get('enable_rsi', True) and prev_rsi is not None and curr_rsi is not None and rsi_change is not None:
-                    rsi_info = f" | RSI: {prev_rsi:.2f}→{curr_rsi:.2f} (+{rsi_change:.2f})"
-                macd_value = stock.get('macd')
+                if enable_rsi and prev_rsi is not None and curr_rsi is not None:
+                    rsi_info = f" | RSI: {prev_rsi:.2f}→{curr_rsi:.2f} (+{curr_rsi - prev_rsi:.2f})"
                 macd_text = f"{macd_value:.2f}" if macd_value is not None else "N/A"
-                ma25_pct = stock.get('price_above_ma25_pct')
                 ma25_text = f"{ma25_pct:.2f}%" if ma25_pct is not None else "N/A"
-                print(f"   📊 이격율: {ma25_text}{rsi_info} | MACD: {macd_text}")
+                out.append(f"   📊 이격율: {ma25_text}{rsi_info} | MACD: {macd_text}")
 
                 if strategy['stop_loss']:
                     sl = strategy['stop_loss']
-                    print(f"   💔 손절가: {sl['price']:,}원 ({sl['pct']:+.2f}%) - {sl['reason']}")
+                    out.append(f"   💔 손절가: {sl['price']:,}원 ({sl['pct']:+.2f}%) - {sl['reason']}")
 
                 if strategy['take_profit']:
                     for tp in strategy['take_profit']:
-                        print(f"   💰 {tp['level']}차 익절: {tp['price']:,}원 ({tp['pct']:+.2f}%) - {tp['reason']} [{tp['action']}]")
+                        out.append(f"   💰 {tp['level']}차 익절: {tp['price']:,}원 ({tp['pct']:+.2f}%) - {tp['reason']} [{tp['action']}]")
 
                 if 'risk_reward_ratio' in strategy:
-                    print(f"   📈 손익비: 1:{strategy['risk_reward_ratio']}")
-
-            print("\n" + "=" * 60)
+                    out.append(f"   📈 손익비: 1:{strategy['risk_reward_ratio']}")
+
+            sys.stdout.write('\n'.join(out) + '\n')
+
+            print("\n" + BAR)
+            # 통계 컬럼을 한 번에 2차원 배열로 모아 NaN(None)을 제외하고 열 단위로 집계
+            stat_cols = ('price_above_ma25_pct', 'prev_rsi', 'curr_rsi', 'macd', 'volume_ratio')
+            stats = np.array([[s.get(col) for col in stat_cols] for s in selected_stocks], dtype=np.float64)
+            # 값이 하나도 없는 열(예: --no-rsi의 RSI)은 기존 pandas 집계처럼 경고 없이 nan으로 출력
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                ma25_mean, prev_rsi_mean, curr_rsi_mean, macd_mean, volume_ratio_mean = np.nanmean(stats, axis=0)
+                ma25_min = np.nanmin(stats[:, 0])
             print("통계 정보:")
-            print(f"  평균 이격율: {df['price_above_ma25_pct'].mean():.2f}%")
-            print(f"  최소 이격율: {df['price_above_ma25_pct'].min():.2f}%")
-            print(f"  평균 RSI (이전→현재): {df['prev_rsi'].mean():.2f} → {df['curr_rsi'].mean():.2f}")
-            print(f"  평균 RSI 변화: +{(df['curr_rsi'].mean() - df['prev_rsi'].mean()):.2f}")
-            print(f"  평균 MACD: {df['macd'].mean():.2f}")
-            print(f"  평균 거래량 비율: {df['volume_ratio'].mean():.2f}배")
+            print(f"  평균 이격율: {ma25_mean:.2f}%")
+            print(f"  최소 이격율: {ma25_min:.2f}%")
+            print(f"  평균 RSI (이전→현재): {prev_rsi_mean:.2f} → {curr_rsi_mean:.2f}")
+            print(f"  평균 RSI 변화: +{(curr_rsi_mean - prev_rsi_mean):.2f}")
+            print(f"  평균 MACD: {macd_mean:.2f}")
+            print(f"  평균 거래량 비율: {volume_ratio_mean:.2f}배")
 
             risk_rewards = [s['trading_strategy'].get('risk_reward_ratio', 0) for s in selected_stocks if 'risk_reward_ratio' in s['trading_strategy']]
             if risk_rewards:
                 print(f"  평균 손익비: 1:{sum(risk_rewards)/len(risk_rewards):.2f}")
-            print("=" * 60)
+            print(BAR)
         else:
             print("선정된 종목이 없습니다.")
             print("기준을 조정해보세요.")
@@ -21,70 +21,189 @@ import os
 import sys
 import argparse
 import csv
+import itertools
+import math
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from multiprocessing.shared_memory import SharedMemory
 from datetime import datetime, timedelta
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _ema_loop(values, period, multiplier, out):
+    """EMA 점화식을 out[period-1:]에 기록 (첫 값은 period일 단순평균, numba 설치 시 JIT 컴파일)"""
+    total = 0.0
+    for i in range(period):
+        total += values[i]
+    out[period - 1] = total / period
+    for i in range(period, values.shape[0]):
+        out[i] = (values[i] - out[i - 1]) * multiplier + out[i - 1]
+
+
+def _rsi_loop(gains, losses, period, out):
+    """Wilder 평활 RSI를 out[1:]에 기록 (numba 설치 시 JIT 컴파일)"""
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(period):
+        avg_gain += gains[i]
+        avg_loss += losses[i]
+    avg_gain /= period
+    avg_loss /= period
+    
+    out[1] = 100.0 if avg_loss == 0 else 100 - (100 / (1 + avg_gain / avg_loss))
+    for i in range(period, gains.shape[0]):
+        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+        out[i - period + 2] = 100.0 if avg_loss == 0 else 100 - (100 / (1 + avg_gain / avg_loss))
+
+
+def _find_signal(candidates, bb_touch):
+    """전체 조건 통과 시점(최신순) 중 최근 3일 내 BB 하단 터치가 있는 첫 시점 탐색 (numba 설치 시 JIT 컴파일)
+    
+    bb_touch: 시점별 BB 하단 터치 여부 (종가 <= 하단 * 1.01) 불리언 배열
+    Returns: (신호 인덱스, 구간 내 가장 이른 터치 인덱스), 없으면 (-1, -1)
+    """
+    for c in range(candidates.shape[0]):
+        i = candidates[c]
+        for j in range(max(0, i - 3), i + 1):
+            if bb_touch[j]:
+                return i, j
+    return -1, -1
+
+
+def _walk_exit(lows, highs, start, stop_loss, take_profit):
+    """start일부터 하루씩 손절(저가 <= 손절가), 익절(고가 >= 익절가) 순으로 도달 여부 확인 (numba 설치 시 JIT 컴파일)
+    
+    Returns: (청산 인덱스, 사유 코드 1: 익절, 2: 손절), 끝까지 도달하지 않으면 (-1, 0)
+    """
+    for i in range(start, lows.shape[0]):
+        if lows[i] <= stop_loss:
+            return i, 2
+        if highs[i] >= take_profit:
+            return i, 1
+    return -1, 0
+
+
+if njit is not None:
+    _ema_loop = njit(cache=True)(_ema_loop)
+    _rsi_loop = njit(cache=True)(_rsi_loop)
+    _find_signal = njit(cache=True)(_find_signal)
+    _walk_exit = njit(cache=True)(_walk_exit)
+else:
+    # numba가 없으면 미리 빌드한 Cython 확장(_indicators.pyx)이 있을 때 점화식만 대체
+    try:
+        from _indicators import ema_loop as _ema_loop, rsi_loop as _rsi_loop
+    except ImportError:
+        pass
+
+
+# 종목별 지표 캐시 {(패널 버전, 종목코드[, 'trend']): 지표 튜플}과 패널 버전 발급기
+_indicator_cache = {}
+_panel_versions = itertools.count()
+
+# 디버그 모드의 조건별 통과 횟수 항목
+DEBUG_STAT_KEYS = ('total_checked', 'trend_filter', 'bb_touch', 'bb_middle_cross',
+                   'volume_surge', 'rsi_recovery', 'macd_gc', 'all_passed')
+
+
+@dataclass(slots=True)
+class Signal:
+    """전략 조건을 만족한 종목의 신호 정보 (백테스트 실행 시 backtest에 결과 딕셔너리)"""
+    code: str
+    name: str
+    signal_date: str
+    signal_index: int
+    bb_touch_date: str
+    bb_touch_index: int
+    entry_price: int
+    current_price: int
+    profit_rate: float
+    bb_position: float
+    volume_ratio: float
+    rsi_value: float
+    macd_value: float
+    macd_signal: float
+    stop_loss: int
+    stop_loss_pct: float
+    take_profit: int
+    take_profit_pct: float
+    risk_reward_ratio: float
+    support_low: int
+    backtest: dict = None
+
 
 class TechnicalIndicators:
-    """기술적 지표 계산 클래스"""
+    """기술적 지표 계산 클래스
+    
+    입력은 ndarray(정수/실수)를 그대로 받아 float64 ndarray로 반환하며 계산 불가 구간은 NaN으로 채운다.
+    """
     
     @staticmethod
     def calculate_ma(data, period):
-        """이동평균 계산"""
-        if len(data) < period:
-            return [None] * len(data)
-        
-        result = [None] * (period - 1)
-        for i in range(period - 1, len(data)):
-            result.append(sum(data[i-period+1:i+1]) / period)
+        """이동평균 계산 (계산 불가 구간은 NaN)"""
+        values = np.asarray(data, dtype=np.float64)
+        result = np.full(len(values), np.nan)
+        if len(values) < period:
+            return result
         
+        result[period - 1:] = sliding_window_view(values, period).mean(axis=1)
         return result
     
+    @staticmethod
+    def calculate_ma_std(data, period):
+        """이동평균과 표준편차를 한 번의 윈도우 계산으로 함께 구함
+        
+        누적합(S1, S2) 점화식은 평탄한 구간에서 상쇄 오차로 분산이 음수가 될 수 있어
+        윈도우마다 평균을 빼고 제곱하는 2-pass 방식(np.std와 동일한 연산 순서)을 유지한다.
+        """
+        values = np.asarray(data, dtype=np.float64)
+        ma = np.full(len(values), np.nan)
+        std = np.full(len(values), np.nan)
+        if len(values) < period:
+            return ma, std
+        
+        windows = sliding_window_view(values, period)
+        mean = windows.mean(axis=1)
+        deviation = windows - mean[:, None]
+        np.multiply(deviation, deviation, out=deviation)
+        ma[period - 1:] = mean
+        std[period - 1:] = np.sqrt(deviation.mean(axis=1))
+        return ma, std
+    
     @staticmethod
     def calculate_std(data, period):
-        """표준편차 계산"""
-        if len(data) < period:
-            return [None] * len(data)
-        
-        result = [None] * (period - 1)
-        for i in range(period - 1, len(data)):
-            window = data[i-period+1:i+1]
-            mean = sum(window) / period
-            variance = sum((x - mean) ** 2 for x in window) / period
-            result.append(variance ** 0.5)
-        
-        return result
+        """표준편차 계산 (모표준편차, 계산 불가 구간은 NaN)"""
+        return TechnicalIndicators.calculate_ma_std(data, period)[1]
     
     @staticmethod
     def calculate_bollinger_bands(data, period=20, num_std=2):
         """볼린저 밴드 계산"""
-        ma = TechnicalIndicators.calculate_ma(data, period)
-        std = TechnicalIndicators.calculate_std(data, period)
-        
-        upper = []
-        lower = []
-        for m, s in zip(ma, std):
-            if m is None or s is None:
-                upper.append(None)
-                lower.append(None)
-            else:
-                upper.append(m + num_std * s)
-                lower.append(m - num_std * s)
+        ma, std = TechnicalIndicators.calculate_ma_std(data, period)
         
-        return ma, upper, lower
+        return ma, ma + num_std * std, ma - num_std * std
     
     @staticmethod
     def calculate_ema(data, period):
-        """지수 이동평균 계산"""
-        if len(data) < period:
-            return [None] * len(data)
-        
-        multiplier = 2 / (period + 1)
-        ema = [None] * (period - 1)
-        ema.append(sum(data[:period]) / period)
-        
-        for i in range(period, len(data)):
-            ema.append((data[i] - ema[-1]) * multiplier + ema[-1])
+        """지수 이동평균 계산 (계산 불가 구간은 NaN)"""
+        values = np.asarray(data, dtype=np.float64)
+        ema = np.full(len(values), np.nan)
+        if len(values) < period:
+            return ema
         
+        _ema_loop(values, period, 2 / (period + 1), ema)
         return ema
     
     @staticmethod
@@ -93,63 +212,48 @@ class TechnicalIndicators:
         ema_fast = TechnicalIndicators.calculate_ema(data, fast)
         ema_slow = TechnicalIndicators.calculate_ema(data, slow)
         
-        macd_line = []
-        for f, s in zip(ema_fast, ema_slow):
-            if f is None or s is None:
-                macd_line.append(None)
-            else:
-                macd_line.append(f - s)
+        # 어느 한쪽이 NaN(계산 불가)이면 차이도 NaN으로 전파됨
+        macd_line = ema_fast - ema_slow
         
-        signal_line = TechnicalIndicators.calculate_ema(
-            [m if m is not None else 0 for m in macd_line], signal
-        )
+        # 시그널선은 계산 불가 구간을 0으로 채운 MACD로 계산
+        signal_line = TechnicalIndicators.calculate_ema(np.nan_to_num(macd_line, nan=0.0), signal)
         
         return macd_line, signal_line
     
     @staticmethod
     def calculate_rsi(data, period=14):
-        """RSI 계산"""
-        if len(data) < period + 1:
-            return [None] * len(data)
-        
-        gains = []
-        losses = []
-        
-        for i in range(1, len(data)):
-            change = data[i] - data[i-1]
-            gains.append(max(change, 0))
-            losses.append(max(-change, 0))
-        
-        result = [None]
-        
-        avg_gain = sum(gains[:period]) / period
-        avg_loss = sum(losses[:period]) / period
-        
-        if avg_loss == 0:
-            result.append(100)
-        else:
-            rs = avg_gain / avg_loss
-            result.append(100 - (100 / (1 + rs)))
-        
-        for i in range(period, len(gains)):
-            avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-            avg_loss = (avg_loss * (period - 1) + losses[i]) / period
-            
-            if avg_loss == 0:
-                result.append(100)
-            else:
-                rs = avg_gain / avg_loss
-                result.append(100 - (100 / (1 + rs)))
-        
+        """RSI 계산 (계산 불가 구간은 NaN)
+
+        결과 배열의 길이와 인덱스 배치는 기존 리스트 구현과 같다:
+        [0]은 NaN, [1]부터 첫 RSI(period일 평균)와 이후 Wilder 평활 값 (길이 len(data) - period + 1)
+        """
+        values = np.asarray(data, dtype=np.float64)
+        if len(values) < period + 1:
+            return np.full(len(values), np.nan)
+        
+        deltas = np.diff(values)
+        gains = np.maximum(deltas, 0.0)
+        losses = np.maximum(-deltas, 0.0)
+        
+        result = np.full(len(gains) - period + 2, np.nan)
+        _rsi_loop(gains, losses, period, result)
         return result
 
 
 class DataLoader:
     """데이터 로딩 클래스"""
     
+    PANEL_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+    # 가격은 원 단위 정수, 거래량은 int32 범위를 넘을 수 있어 int64 (지표 계산 시 float64로 변환)
+    PANEL_DTYPES = {'open': np.int32, 'high': np.int32, 'low': np.int32, 'close': np.int32, 'volume': np.int64}
+    PANEL_CACHE_NAME = 'kospi200_panel.npz'
+    
     @staticmethod
     def load_kospi200_data(start_date, end_date):
-        """KOSPI 200 데이터 로드"""
+        """KOSPI 200 데이터 로드
+        
+        Returns: 기간 내 거래일만 날짜순으로 모은 패널 (build_panel 형식) 또는 None
+        """
         base_dir = "data/json/kospi200"
         
         if not os.path.exists(base_dir):
@@ -161,79 +265,216 @@ class DataLoader:
         start_year = int(start_date[:4])
         end_year = int(end_date[:4])
         
-        all_days = []
-        for year in range(start_year, end_year + 1):
-            file_path = f"{base_dir}/{year}/kospi200_data.json"
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    year_data_count = len(data['data'])
-                    all_days.extend(data['data'])
-                    print(f"  ✓ {year}년 데이터 로드: {year_data_count}일")
+        year_files = {year: f"{base_dir}/{year}/kospi200_data.json" for year in range(start_year, end_year + 1)}
+        existing = [year for year, file_path in year_files.items() if os.path.exists(file_path)]
+        
+        # 연도별 파일은 서로 독립적이므로 여러 해를 스레드로 동시에 읽음 (출력은 연도 순서대로)
+        if len(existing) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(existing))) as executor:
+                loaded = dict(zip(existing, executor.map(DataLoader.load_year_panel,
+                                                         [year_files[year] for year in existing])))
+        else:
+            loaded = {year: DataLoader.load_year_panel(year_files[year]) for year in existing}
+        
+        year_panels = []
+        for year, file_path in year_files.items():
+            if year in loaded:
+                year_panel = loaded[year]
+                year_panels.append(year_panel)
+                print(f"  ✓ {year}년 데이터 로드: {len(year_panel['date'])}일")
             else:
                 print(f"  ⚠️  {year}년 데이터 파일 없음: {file_path}")
         
-        if not all_days:
+        if not any(len(p['date']) for p in year_panels):
             print(f"❌ 데이터가 없습니다.")
             print(f"   먼저 get_data.py를 실행하여 데이터를 수집하세요:")
             print(f"   python get_data.py --config config.json --from {start_date} --to {end_date}")
             return None
         
-        filtered_days = [d for d in all_days if start_date <= d['date'] <= end_date]
+        panel = DataLoader.merge_panels(year_panels)
+        dates = panel['date']
+        in_range = (dates >= start_date) & (dates <= end_date)
         
-        if not filtered_days:
+        if not in_range.any():
             print(f"❌ {start_date} ~ {end_date} 기간의 데이터가 없습니다.")
             print(f"   먼저 get_data.py를 실행하여 데이터를 수집하세요:")
             print(f"   python get_data.py --config config.json --from {start_date} --to {end_date}")
             return None
         
-        trading_days = [d for d in filtered_days if not d['is_holiday']]
+        trading = np.flatnonzero(in_range & ~panel['is_holiday'])
         
-        if not trading_days:
+        if not len(trading):
             print(f"❌ 기간 내 거래일이 없습니다.")
             return None
         
-        return sorted(trading_days, key=lambda x: x['date'])
+        trading = trading[np.argsort(dates[trading], kind='stable')]
+        return DataLoader.select_days(panel, trading)
     
     @staticmethod
-    def get_stock_timeseries(trading_days, stock_code):
-        """특정 종목의 시계열 데이터 추출"""
-        timeseries = []
+    def load_year_panel(file_path):
+        """연도별 JSON을 패널로 로드 (JSON보다 새로운 .npz 캐시가 있으면 JSON 파싱 생략)"""
+        cache_path = os.path.join(os.path.dirname(file_path), DataLoader.PANEL_CACHE_NAME)
+        
+        if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(file_path):
+            try:
+                with np.load(cache_path) as cached:
+                    panel = {key: cached[key] for key in cached.files}
+                # 이전 형식(float64 가격)으로 저장된 캐시는 다시 생성
+                if all(panel[col].dtype == DataLoader.PANEL_DTYPES[col] for col in DataLoader.PANEL_FIELDS):
+                    return panel
+            except Exception as e:
+                print(f"  ⚠️  패널 캐시 로드 실패: {cache_path} -> {e}")
+        
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson else json.loads(raw)
+        panel = DataLoader.build_panel(data['data'])
+        
+        # 임시 파일에 쓴 뒤 교체해 동시에 실행된 다른 프로세스가 쓰다 만 캐시를 읽지 않도록 함
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, **panel)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"  ⚠️  패널 캐시 저장 실패: {cache_path} -> {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        
+        return panel
+    
+    @staticmethod
+    def build_panel(days):
+        """일자별 종목 리스트를 (종목 × 일자) 2차원 배열 패널로 변환
+        
+        Returns: {'date': 일자 배열, 'is_holiday': 휴장 여부, 'code'/'name': 종목 배열,
+                  'position': 일자별 종목 리스트 내 순서 (없으면 -1),
+                  'open'/'high'/'low'/'close': int32, 'volume': int64 (종목 × 일자) 배열}
+        """
+        codes = {}
+        names = []
+        entries = []
+        
+        for i, day in enumerate(days):
+            seen = set()
+            for pos, s in enumerate(day['stocks']):
+                code = s['code']
+                if code in seen:
+                    continue  # 같은 날 중복 항목은 첫 번째만 사용
+                seen.add(code)
+                j = codes.setdefault(code, len(codes))
+                if j == len(names):
+                    names.append(s['name'])
+                else:
+                    names[j] = s['name']
+                entries.append((j, i, pos, *(s[col] for col in DataLoader.PANEL_FIELDS)))
+        
+        shape = (len(codes), len(days))
+        panel = {
+            'date': np.array([day['date'] for day in days], dtype=str),
+            'is_holiday': np.array([day['is_holiday'] for day in days], dtype=bool),
+            'code': np.array(list(codes), dtype=str),
+            'name': np.array(names, dtype=str),
+            'position': np.full(shape, -1, dtype=np.int32),
+        }
+        for col in DataLoader.PANEL_FIELDS:
+            panel[col] = np.zeros(shape, dtype=DataLoader.PANEL_DTYPES[col])
         
-        for day in trading_days:
-            stock = next((s for s in day['stocks'] if s['code'] == stock_code), None)
-            if stock:
-                timeseries.append({
-                    'date': day['date'],
-                    'open': stock['open'],
-                    'high': stock['high'],
-                    'low': stock['low'],
-                    'close': stock['close'],
-                    'volume': stock['volume']
-                })
+        if entries:
+            rows, cols, positions, *values = zip(*entries)
+            panel['position'][rows, cols] = positions
+            for col, col_values in zip(DataLoader.PANEL_FIELDS, values):
+                panel[col][rows, cols] = col_values
         
-        return timeseries
+        return panel
+    
+    @staticmethod
+    def merge_panels(panels):
+        """연도별 패널을 일자 방향으로 이어 붙임 (종목 구성이 다르면 종목 축을 합집합으로 맞춤)"""
+        if len(panels) == 1:
+            return panels[0]
+        
+        codes = {}
+        names = []
+        for panel in panels:
+            for code, name in zip(panel['code'].tolist(), panel['name'].tolist()):
+                j = codes.setdefault(code, len(codes))
+                if j == len(names):
+                    names.append(name)
+                else:
+                    names[j] = name
+        
+        merged = {
+            'date': np.concatenate([p['date'] for p in panels]),
+            'is_holiday': np.concatenate([p['is_holiday'] for p in panels]),
+            'code': np.array(list(codes), dtype=str),
+            'name': np.array(names, dtype=str),
+        }
+        for col, fill in (('position', -1), *((col, 0) for col in DataLoader.PANEL_FIELDS)):
+            parts = []
+            for panel in panels:
+                rows = np.array([codes[code] for code in panel['code'].tolist()], dtype=np.intp)
+                part = np.full((len(codes), len(panel['date'])), fill, dtype=panel[col].dtype)
+                part[rows] = panel[col]
+                parts.append(part)
+            merged[col] = np.concatenate(parts, axis=1)
+        
+        return merged
+    
+    @staticmethod
+    def select_days(panel, day_indices):
+        """패널에서 지정한 일자 열만 선택"""
+        selected = {'code': panel['code'], 'name': panel['name']}
+        for key in ('date', 'is_holiday'):
+            selected[key] = panel[key][day_indices]
+        for col in ('position', *DataLoader.PANEL_FIELDS):
+            selected[col] = panel[col][:, day_indices]
+        return selected
+    
+    @staticmethod
+    def latest_stocks(panel):
+        """마지막 거래일의 종목 목록 (해당일 데이터 순서)"""
+        positions = panel['position'][:, -1]
+        rows = np.flatnonzero(positions >= 0)
+        rows = rows[np.argsort(positions[rows], kind='stable')]
+        return [{'code': panel['code'][j], 'name': panel['name'][j]} for j in rows.tolist()]
+    
+    @staticmethod
+    def stock_panels(panel):
+        """종목별 시계열 배열 (데이터가 있는 일자만)
+        
+        Returns: {종목코드: {'date': 날짜 배열, 'open'/'high'/'low'/'close'/'volume': 정수 배열}}
+        """
+        present = panel['position'] >= 0
+        stocks = {}
+        for j, code in enumerate(panel['code'].tolist()):
+            days = np.flatnonzero(present[j])
+            if not len(days):
+                continue
+            stock_panel = {'date': panel['date'][days]}
+            for col in DataLoader.PANEL_FIELDS:
+                stock_panel[col] = panel[col][j, days]
+            stocks[code] = stock_panel
+        return stocks
 
 
 class StockScreener:
     """종목 선별 클래스"""
     
-    def __init__(self, trading_days, silent=False):
-        self.trading_days = trading_days
-        self.all_stocks = self._get_all_stock_codes()
+    def __init__(self, panel, silent=False):
+        self.panel = panel
+        self.all_stocks = DataLoader.latest_stocks(panel)
+        self.panels = DataLoader.stock_panels(panel)
+        # 지표 캐시 키 (새 패널이 들어오면 이전 패널의 지표는 버림)
+        self.panel_version = next(_panel_versions)
+        _indicator_cache.clear()
         self.silent = silent
     
-    def _get_all_stock_codes(self):
-        """모든 종목 코드 추출"""
-        if not self.trading_days:
-            return []
+    def find_bollinger_volume_stocks(self, start_date=None, end_date=None, low_period=12, debug=False, workers=None):
+        """볼린저 밴드 + 거래량 전략 종목 찾기
         
-        latest_day = self.trading_days[-1]
-        stocks = [{'code': s['code'], 'name': s['name']} for s in latest_day['stocks']]
-        return stocks
-    
-    def find_bollinger_volume_stocks(self, start_date=None, end_date=None, low_period=12, debug=False):
-        """볼린저 밴드 + 거래량 전략 종목 찾기"""
+        workers > 1이면 종목별 검사를 ProcessPoolExecutor로 병렬 처리한다. workers=0이면 CPU 코어 수만큼 사용한다.
+        """
         if not self.silent:
             print(f"\n{'='*60}")
             print(f"볼린저 밴드 + 거래량 전략 종목 검색")
@@ -243,141 +484,37 @@ class StockScreener:
         total = len(self.all_stocks)
         
         # 디버그용 통계
-        debug_stats = {
-            'total_checked': 0,
-            'trend_filter': 0,
-            'bb_touch': 0,
-            'bb_middle_cross': 0,
-            'volume_surge': 0,
-            'rsi_recovery': 0,
-            'macd_gc': 0,
-            'all_passed': 0
-        }
-        
-        for idx, stock_info in enumerate(self.all_stocks, 1):
-            if not self.silent and idx % 50 == 0:
-                print(f"진행중: {idx}/{total} ({idx/total*100:.1f}%)")
-            
-            stock_code = stock_info['code']
-            stock_name = stock_info['name']
-            
-            timeseries = DataLoader.get_stock_timeseries(self.trading_days, stock_code)
-            
-            if len(timeseries) < 150:  # 120일 + 여유
-                continue
-            
-            closes = [t['close'] for t in timeseries]
-            volumes = [t['volume'] for t in timeseries]
-            lows = [t['low'] for t in timeseries]
-            
-            # 볼린저 밴드 계산
-            bb_middle, bb_upper, bb_lower = TechnicalIndicators.calculate_bollinger_bands(closes, 20, 2)
-            
-            # MACD 계산
-            macd_line, signal_line = TechnicalIndicators.calculate_macd(closes)
-            
-            # RSI 계산
-            rsi_line = TechnicalIndicators.calculate_rsi(closes, 14)
-            
-            # 평균 거래량 계산
-            avg_volume = TechnicalIndicators.calculate_ma(volumes, 20)
-            
-            # 추세 확인용 이동평균선 계산
-            ma60 = TechnicalIndicators.calculate_ma(closes, 60)
-            ma120 = TechnicalIndicators.calculate_ma(closes, 120)
-            
-            # 검색 범위 설정: start_date부터 end_date 사이의 인덱스 찾기
-            search_start_idx = 0  # 0부터 시작 (조건 체크에서 120일 이상만 검사)
-            search_end_idx = len(timeseries)
-            
-            if start_date:
-                # start_date에 해당하는 인덱스 찾기
-                for i, t in enumerate(timeseries):
-                    if t['date'] >= start_date:
-                        search_start_idx = i
-                        break
-            
-            if end_date:
-                # end_date에 해당하는 인덱스 찾기
-                for i, t in enumerate(timeseries):
-                    if t['date'] > end_date:
-                        search_end_idx = i
-                        break
-            
-            # 전략 조건 확인 (역순: 최신 신호 우선)
-            for i in range(search_end_idx - 1, search_start_idx - 1, -1):
-                passed, stage = self._check_strategy_conditions(
-                    i, closes, volumes, lows, bb_middle, bb_upper, bb_lower,
-                    macd_line, signal_line, rsi_line, avg_volume, ma60, ma120, debug
-                )
-                
-                if debug and stage > 0:
-                    debug_stats['total_checked'] += 1
-                    if stage >= 1: debug_stats['trend_filter'] += 1
-                    if stage >= 2: debug_stats['bb_touch'] += 1
-                    if stage >= 3: debug_stats['bb_middle_cross'] += 1
-                    if stage >= 4: debug_stats['volume_surge'] += 1
-                    if stage >= 5: debug_stats['rsi_recovery'] += 1
-                    if stage >= 6: debug_stats['macd_gc'] += 1
-                    if passed: debug_stats['all_passed'] += 1
-                
-                if passed:
-                    # 조건 만족 시점의 정보 수집
-                    bb_touch_idx = self._find_bb_lower_touch(i, closes, bb_lower)
-                    
-                    if bb_touch_idx is None:
-                        continue
-                    
-                    entry_price = closes[i]
-                    current_close = closes[-1]
-                    
-                    # 손절가 계산 (BB 하단 터치일 기준 이전 N일 최저가)
-                    lookback_start = max(0, bb_touch_idx - low_period)
-                    lookback_end = bb_touch_idx + 1
-                    support_low = min(lows[lookback_start:lookback_end])
-                    
-                    stop_loss_amount = entry_price - support_low
-                    stop_loss = int(support_low)
-                    stop_loss_pct = ((support_low - entry_price) / entry_price) * 100 if entry_price != 0 else 0
-                    
-                    take_profit = int(entry_price + (stop_loss_amount * 2))
-                    take_profit_pct = ((take_profit - entry_price) / entry_price) * 100 if entry_price != 0 else 0
-                    
-                    profit_rate = ((current_close - entry_price) / entry_price) * 100 if entry_price != 0 else 0
-                    
-                    # 볼린저 밴드 위치 계산
-                    bb_position = ((current_close - bb_lower[-1]) / (bb_upper[-1] - bb_lower[-1]) * 100) if (bb_upper[-1] - bb_lower[-1]) != 0 else 50
-                    
-                    selected_stocks.append({
-                        'code': stock_code,
-                        'name': stock_name,
-                        'signal_date': timeseries[i]['date'],
-                        'signal_index': i,
-                        'bb_touch_date': timeseries[bb_touch_idx]['date'],
-                        'bb_touch_index': bb_touch_idx,
-                        'entry_price': int(entry_price),
-                        'current_price': int(current_close),
-                        'profit_rate': round(profit_rate, 2),
-                        'bb_position': round(bb_position, 2),
-                        'volume_ratio': round(volumes[i] / avg_volume[i], 2) if avg_volume[i] and avg_volume[i] != 0 else 0,
-                        'rsi_value': round(rsi_line[i], 2) if rsi_line[i] is not None else 0,
-                        'macd_value': round(macd_line[i], 2) if macd_line[i] is not None else 0,
-                        'macd_signal': round(signal_line[i], 2) if signal_line[i] is not None else 0,
-                        'stop_loss': stop_loss,
-                        'stop_loss_pct': round(stop_loss_pct, 2),
-                        'take_profit': take_profit,
-                        'take_profit_pct': round(take_profit_pct, 2),
-                        'risk_reward_ratio': 2.0,
-                        'support_low': int(support_low)
-                    })
-                    break  # 종목당 한 번만
+        debug_stats = dict.fromkeys(DEBUG_STAT_KEYS, 0)
+        
+        if workers is not None and workers <= 0:
+            workers = os.cpu_count() or 1
+        
+        if workers and workers > 1 and self.panels:
+            # 종목별 배열은 공유 메모리로 넘기고 작업에는 (offset, length)만 담아 피클링 비용을 줄임
+            shm, spec, layout = _share_panels(self.panels)
+            try:
+                tasks = ((stock_info, layout.get(stock_info['code']), self.panel_version,
+                          start_date, end_date, low_period, debug)
+                         for stock_info in self.all_stocks)
+                with ProcessPoolExecutor(max_workers=workers, initializer=_attach_shared_panels,
+                                         initargs=(shm.name, spec)) as executor:
+                    self._collect_results(executor.map(_screen_shared, tasks, chunksize=8), total,
+                                          selected_stocks, debug_stats)
+            finally:
+                shm.close()
+                shm.unlink()
+        else:
+            tasks = ((stock_info, self.panels.get(stock_info['code']), self.panel_version,
+                      start_date, end_date, low_period, debug)
+                     for stock_info in self.all_stocks)
+            self._collect_results(map(_screen_one, tasks), total, selected_stocks, debug_stats)
         
         if not self.silent:
             print(f"\n✓ 전략 조건 만족 종목: {len(selected_stocks)}개")
             for stock in selected_stocks[:10]:
-                print(f"  - {stock['name']} ({stock['code']}): {stock['signal_date']}, "
-                      f"진입가 {stock['entry_price']:,}원 → 현재가 {stock['current_price']:,}원 ({stock['profit_rate']:+.1f}%), "
-                      f"거래량 {stock['volume_ratio']:.1f}배")
+                print(f"  - {stock.name} ({stock.code}): {stock.signal_date}, "
+                      f"진입가 {stock.entry_price:,}원 → 현재가 {stock.current_price:,}원 ({stock.profit_rate:+.1f}%), "
+                      f"거래량 {stock.volume_ratio:.1f}배")
             
             if len(selected_stocks) > 10:
                 print(f"  ... 외 {len(selected_stocks) - 10}개 종목")
@@ -405,99 +542,319 @@ class StockScreener:
         
         return selected_stocks
     
-    def _check_strategy_conditions(self, idx, closes, volumes, lows, bb_middle, bb_upper, bb_lower,
-                                   macd_line, signal_line, rsi_line, avg_volume, ma60, ma120, debug=False):
-        """전략 조건 확인 (반환: (통과여부, 도달단계))"""
-        stage = 0
-        
-        if idx < 120:  # 최소 120일 전 데이터 필요
-            return False, stage
-        
-        # 인덱스 범위 확인
-        if (idx >= len(rsi_line) or idx >= len(avg_volume) or 
-            idx >= len(bb_middle) or idx >= len(bb_lower) or idx >= len(bb_upper) or
-            idx >= len(macd_line) or idx >= len(signal_line) or
-            idx >= len(ma60) or idx >= len(ma120)):
-            return False, stage
-        
-        # 필수 값 확인
-        if None in [bb_middle[idx], bb_upper[idx], bb_lower[idx], macd_line[idx], signal_line[idx], 
-                    rsi_line[idx], avg_volume[idx], ma60[idx], ma120[idx]]:
-            return False, stage
-        
-        # 1. 추세 필터: 중장기 상승 추세 확인 (가장 중요!)
-        # - 60일선 > 120일선: 중장기 상승 추세
-        # - 현재가 > 60일선: 단기도 상승 추세
-        if ma60[idx] <= ma120[idx] or closes[idx] <= ma60[idx]:
-            return False, stage
-        stage = 1
-        
-        # 2. 3일 이내 볼린저 밴드 하단 터치 확인
-        bb_touched = False
-        for j in range(max(0, idx - 3), idx + 1):
-            if j < len(bb_lower) and j < len(lows) and bb_lower[j] is not None and lows[j] <= bb_lower[j]:
-                bb_touched = True
-                break
-        
-        if not bb_touched:
-            return False, stage
-        stage = 2
-        
-        # 3. 현재 중심선(20일 MA) 돌파 확인
-        if closes[idx] <= bb_middle[idx]:
-            return False, stage
-        stage = 3
+    def _collect_results(self, screened, total, selected_stocks, debug_stats):
+        """종목별 검사 결과를 순서대로 모으며 진행 상황 출력 및 디버그 통계 합산"""
+        for idx, (selected, stock_stats) in enumerate(screened, 1):
+            if not self.silent and idx % 50 == 0:
+                print(f"진행중: {idx}/{total} ({idx/total*100:.1f}%)")
+            
+            for key, count in stock_stats.items():
+                debug_stats[key] += count
+            
+            if selected is not None:
+                selected_stocks.append(selected)
+    
+    @staticmethod
+    def _strategy_stages(closes, volumes, lows, bb_middle, bb_upper, bb_lower,
+                         macd_line, signal_line, rsi_line, avg_volume, ma60, ma120):
+        """모든 시점의 전략 조건 도달 단계를 한 번에 계산 (6이면 전체 조건 통과)
+        
+        각 조건을 전체 시계열에 대한 불리언 배열로 계산해 순서대로 누적한다.
+        Returns: 시점별 도달 단계 int 배열 (0: 추세 필터 탈락 또는 검사 불가)
+        """
+        n = len(closes)
+        
+        # RSI는 시계열보다 짧으므로 (calculate_rsi 참고) 길이를 맞추고 범위 밖은 NaN
+        rsi = np.full(n, np.nan)
+        rsi[:min(n, len(rsi_line))] = rsi_line[:n]
+        
+        # 최소 120일 전 데이터 필요 + 필수 값 확인
+        valid = np.arange(n) >= 120
+        for values in (bb_middle, bb_upper, bb_lower, macd_line, signal_line, rsi, avg_volume, ma60, ma120):
+            valid &= ~np.isnan(values)
+        
+        def recent_any(mask, days):
+            """시점별로 최근 days일(당일 포함) 중 하나라도 True인지"""
+            padded = np.concatenate((np.zeros(days, dtype=bool), mask))
+            return sliding_window_view(padded, days + 1).any(axis=1)
+        
+        # 1. 추세 필터: 60일선 > 120일선, 현재가 > 60일선
+        trend = (ma60 > ma120) & (closes > ma60)
+        
+        # 2. 3일 이내 볼린저 밴드 하단 터치
+        bb_touched = recent_any(lows <= bb_lower, 3)
+        
+        # 3. 현재 중심선(20일 MA) 돌파
+        middle_cross = closes > bb_middle
         
         # 4. 거래량 1.5배 이상 증가
-        if avg_volume[idx] == 0 or volumes[idx] < avg_volume[idx] * 1.5:
-            return False, stage
-        stage = 4
-        
-        # 5. RSI 회복 확인
-        # - 과거 10일 내 RSI 40 이하였던 시점이 있어야 함
-        # - 현재 RSI가 그때보다 5 이상 상승해야 함
-        rsi_recovery = False
-        min_rsi_in_period = None
-        
-        for j in range(max(0, idx - 10), idx + 1):
-            if j < len(rsi_line) and rsi_line[j] is not None:
-                if min_rsi_in_period is None or rsi_line[j] < min_rsi_in_period:
-                    min_rsi_in_period = rsi_line[j]
-        
-        current_rsi = rsi_line[idx] if idx < len(rsi_line) and rsi_line[idx] is not None else None
-        
-        if min_rsi_in_period is not None and current_rsi is not None:
-            if min_rsi_in_period <= 40 and current_rsi >= min_rsi_in_period + 5:
-                rsi_recovery = True
-        
-        if not rsi_recovery:
-            return False, stage
-        stage = 5
-        
-        # 6. MACD 골든크로스 + 히스토그램 양수 확인 (강화!)
-        macd_gc = False
-        for j in range(max(1, idx - 10), idx + 1):
-            if (j < len(macd_line) and j < len(signal_line) and j > 0 and
-                macd_line[j] is not None and signal_line[j] is not None and
-                macd_line[j-1] is not None and signal_line[j-1] is not None):
-                # 골든크로스 + MACD 히스토그램이 양수
-                if (macd_line[j-1] <= signal_line[j-1] and macd_line[j] > signal_line[j] and
-                    macd_line[j] - signal_line[j] > 0):
-                    macd_gc = True
-                    break
-        
-        if not macd_gc:
-            return False, stage
-        stage = 6
-        
-        return True, stage
-    
-    def _find_bb_lower_touch(self, current_idx, closes, bb_lower):
-        """볼린저 밴드 하단 터치 시점 찾기 (최근 3일 내)"""
-        for j in range(max(0, current_idx - 3), current_idx + 1):
-            if j < len(bb_lower) and j < len(closes) and bb_lower[j] is not None and closes[j] <= bb_lower[j] * 1.01:  # 1% 여유
-                return j
-        return None
+        volume_surge = (avg_volume != 0) & (volumes >= avg_volume * 1.5)
+        
+        # 5. RSI 회복: 과거 10일 내 최저 RSI가 40 이하이고 현재 RSI가 그보다 5 이상 상승
+        rsi_for_min = np.concatenate((np.full(10, np.inf), np.where(np.isnan(rsi), np.inf, rsi)))
+        min_rsi = sliding_window_view(rsi_for_min, 11).min(axis=1)
+        rsi_recovery = (min_rsi <= 40) & (rsi >= min_rsi + 5)
+        
+        # 6. 10일 내 MACD 골든크로스 + 히스토그램 양수
+        golden_cross = np.zeros(n, dtype=bool)
+        golden_cross[1:] = ((macd_line[:-1] <= signal_line[:-1]) & (macd_line[1:] > signal_line[1:]) &
+                            (macd_line[1:] - signal_line[1:] > 0))
+        macd_gc = recent_any(golden_cross, 10)
+        
+        stages = np.zeros(n, dtype=np.int64)
+        reached = valid
+        for condition in (trend, bb_touched, middle_cross, volume_surge, rsi_recovery, macd_gc):
+            reached = reached & condition
+            stages += reached
+        
+        return stages
+
+
+def _stock_trend(stock_code, panel_version, panel):
+    """추세 확인용 60/120일 이동평균과 1단계 추세 필터(60일선 > 120일선, 현재가 > 60일선) 계산
+    
+    다른 지표보다 먼저, 따로 캐시해 추세 필터를 통과하지 못하는 종목은 나머지 지표 계산을 생략한다.
+    """
+    key = (panel_version, stock_code, 'trend')
+    trend = _indicator_cache.get(key)
+    if trend is None:
+        closes = panel['close']
+        ma60 = TechnicalIndicators.calculate_ma(closes, 60)
+        ma120 = TechnicalIndicators.calculate_ma(closes, 120)
+        # 이동평균이 NaN인 구간은 비교 결과가 False
+        trend = (ma60, ma120, (ma60 > ma120) & (closes > ma60))
+        _indicator_cache[key] = trend
+    return trend
+
+
+def _stock_indicators(stock_code, panel_version, panel):
+    """종목별 지표, 전략 도달 단계, BB 하단 터치 여부 계산
+    
+    결과는 (패널 버전, 종목코드) 키로 모듈 캐시에 보관해 같은 패널로 기간/파라미터만 바꿔
+    다시 검사할 때 재사용한다 (워커 프로세스는 프로세스별 캐시).
+    """
+    key = (panel_version, stock_code)
+    indicators = _indicator_cache.get(key)
+    if indicators is not None:
+        return indicators
+    
+    closes = panel['close']
+    volumes = panel['volume']
+    lows = panel['low']
+    ma60, ma120, _ = _stock_trend(stock_code, panel_version, panel)
+    
+    # 볼린저 밴드 계산
+    bb_middle, bb_upper, bb_lower = TechnicalIndicators.calculate_bollinger_bands(closes, 20, 2)
+    
+    # MACD 계산
+    macd_line, signal_line = TechnicalIndicators.calculate_macd(closes)
+    
+    # RSI 계산
+    rsi_line = TechnicalIndicators.calculate_rsi(closes, 14)
+    
+    # 평균 거래량 계산
+    avg_volume = TechnicalIndicators.calculate_ma(volumes, 20)
+    
+    # 전체 시점의 전략 조건 도달 단계
+    stages = StockScreener._strategy_stages(
+        closes, volumes, lows, bb_middle, bb_upper, bb_lower,
+        macd_line, signal_line, rsi_line, avg_volume, ma60, ma120
+    )
+    
+    # BB 하단 터치 여부 (1% 여유, 하단이 NaN이면 비교 결과가 False)
+    bb_touch = closes <= bb_lower * 1.01
+    
+    indicators = (bb_middle, bb_upper, bb_lower, macd_line, signal_line, rsi_line, avg_volume, stages, bb_touch)
+    _indicator_cache[key] = indicators
+    return indicators
+
+
+def _screen_one(args):
+    """단일 종목 전략 검사 (프로세스 풀에서 호출할 수 있도록 모듈 수준 함수)
+    
+    Returns: (선정 종목 정보 또는 None, 디버그 통계 딕셔너리)
+    """
+    stock_info, panel, panel_version, start_date, end_date, low_period, debug = args
+    debug_stats = dict.fromkeys(DEBUG_STAT_KEYS, 0)
+    
+    stock_code = stock_info['code']
+    stock_name = stock_info['name']
+    
+    if panel is None or len(panel['close']) < 150:  # 120일 + 여유
+        return None, debug_stats
+    
+    dates = panel['date']
+    closes = panel['close']
+    volumes = panel['volume']
+    lows = panel['low']
+    
+    # 검색 범위 설정: start_date부터 end_date 사이의 인덱스 찾기
+    search_start_idx = 0  # 0부터 시작 (조건 체크에서 120일 이상만 검사)
+    search_end_idx = len(dates)
+    
+    if start_date:
+        # start_date 이상인 첫 인덱스 (정렬된 일자 배열 이진 탐색, 없으면 처음부터 검색)
+        i = int(np.searchsorted(dates, start_date, side='left'))
+        if i < len(dates):
+            search_start_idx = i
+    
+    if end_date:
+        # end_date를 넘는 첫 인덱스
+        search_end_idx = int(np.searchsorted(dates, end_date, side='right'))
+    
+    # 검색 구간에 추세 필터를 통과하는 시점이 없으면 전략 단계가 모두 0이므로 나머지 지표 계산 생략
+    if not _stock_trend(stock_code, panel_version, panel)[2][search_start_idx:search_end_idx].any():
+        return None, debug_stats
+    
+    # 지표와 전략 단계 (검색 기간과 무관하므로 같은 패널이면 재사용)
+    (bb_middle, bb_upper, bb_lower, macd_line, signal_line, rsi_line,
+     avg_volume, stages, bb_touch) = _stock_indicators(stock_code, panel_version, panel)
+    
+    # 전략 조건 확인 (최신 신호 우선)
+    candidates = (np.flatnonzero(stages[search_start_idx:search_end_idx] == 6) + search_start_idx)[::-1]
+    signal_idx, bb_touch_idx = _find_signal(candidates, bb_touch)
+    if signal_idx < 0:
+        signal_idx = bb_touch_idx = None
+    else:
+        signal_idx, bb_touch_idx = int(signal_idx), int(bb_touch_idx)
+    
+    if debug:
+        # 최신 시점부터 신호가 선정된 시점까지 검사한 것으로 집계
+        scanned = stages[search_start_idx if signal_idx is None else signal_idx:search_end_idx]
+        for stage, key in enumerate(('trend_filter', 'bb_touch', 'bb_middle_cross',
+                                     'volume_surge', 'rsi_recovery', 'macd_gc'), 1):
+            debug_stats[key] = int(np.count_nonzero(scanned >= stage))
+        debug_stats['total_checked'] = debug_stats['trend_filter']
+        debug_stats['all_passed'] = debug_stats['macd_gc']
+    
+    if signal_idx is None:
+        return None, debug_stats
+    
+    # 조건 만족 시점의 정보 수집 (종목당 한 번만, 가장 최근 신호)
+    entry_price = float(closes[signal_idx])
+    current_close = float(closes[-1])
+    
+    # 손절가 계산 (BB 하단 터치일 기준 이전 N일 최저가)
+    lookback_start = max(0, bb_touch_idx - low_period)
+    lookback_end = bb_touch_idx + 1
+    support_low = float(lows[lookback_start:lookback_end].min())
+    
+    stop_loss_amount = entry_price - support_low
+    stop_loss = int(support_low)
+    stop_loss_pct = ((support_low - entry_price) / entry_price) * 100 if entry_price != 0 else 0
+    
+    take_profit = int(entry_price + (stop_loss_amount * 2))
+    take_profit_pct = ((take_profit - entry_price) / entry_price) * 100 if entry_price != 0 else 0
+    
+    profit_rate = ((current_close - entry_price) / entry_price) * 100 if entry_price != 0 else 0
+    
+    # 신호 시점 지표 값 (스칼라는 float로 꺼내 math.isnan으로 확인)
+    rsi_value = float(rsi_line[signal_idx])
+    macd_value = float(macd_line[signal_idx])
+    macd_signal = float(signal_line[signal_idx])
+    
+    # 볼린저 밴드 위치 계산
+    bb_width = float(bb_upper[-1] - bb_lower[-1])
+    bb_position = ((current_close - float(bb_lower[-1])) / bb_width * 100) if bb_width != 0 else 50
+    
+    return Signal(
+        code=stock_code,
+        name=stock_name,
+        signal_date=str(dates[signal_idx]),
+        signal_index=signal_idx,
+        bb_touch_date=str(dates[bb_touch_idx]),
+        bb_touch_index=bb_touch_idx,
+        entry_price=int(entry_price),
+        current_price=int(current_close),
+        profit_rate=round(profit_rate, 2),
+        bb_position=round(bb_position, 2),
+        volume_ratio=round(float(volumes[signal_idx] / avg_volume[signal_idx]), 2) if avg_volume[signal_idx] != 0 else 0,
+        rsi_value=round(rsi_value, 2) if not math.isnan(rsi_value) else 0,
+        macd_value=round(macd_value, 2) if not math.isnan(macd_value) else 0,
+        macd_signal=round(macd_signal, 2) if not math.isnan(macd_signal) else 0,
+        stop_loss=stop_loss,
+        stop_loss_pct=round(stop_loss_pct, 2),
+        take_profit=take_profit,
+        take_profit_pct=round(take_profit_pct, 2),
+        risk_reward_ratio=2.0,
+        support_low=int(support_low)
+    ), debug_stats
+
+
+# 워커 프로세스에서 연결한 공유 메모리와 그 위의 배열 뷰
+_shared_panels = {}
+
+
+def _shared_blocks(spec):
+    """공유 메모리 내 항목별 블록 배치 계산 (각 블록은 8바이트 경계에 정렬)
+    
+    Returns: ([(항목명, dtype, 바이트 offset)], 전체 바이트 수)
+    """
+    total, dtypes = spec
+    blocks = []
+    nbytes = 0
+    for key, dtype in dtypes:
+        dtype = np.dtype(dtype)
+        blocks.append((key, dtype, nbytes))
+        nbytes += -(-total * dtype.itemsize // 8) * 8
+    return blocks, nbytes
+
+
+def _shared_views(shm, spec):
+    """공유 메모리 블록 위에 항목별(일자, 가격/거래량) 전체 길이 배열 뷰를 만듦"""
+    total = spec[0]
+    blocks, _ = _shared_blocks(spec)
+    return {key: np.ndarray((total,), dtype=dtype, buffer=shm.buf, offset=offset)
+            for key, dtype, offset in blocks}
+
+
+def _share_panels(panels):
+    """종목별 패널을 하나의 공유 메모리 블록에 이어 붙임 (워커 프로세스에 복사 없이 전달)
+    
+    Returns: (SharedMemory, 블록 정보 (전체 길이, 항목별 dtype), {종목코드: (offset, length)})
+    """
+    layout = {}
+    total = 0
+    for code, stock_panel in panels.items():
+        layout[code] = (total, len(stock_panel['date']))
+        total += len(stock_panel['date'])
+    
+    keys = ('date', *DataLoader.PANEL_FIELDS)
+    spec = (total, tuple((key, np.result_type(*(p[key].dtype for p in panels.values())).str) for key in keys))
+    shm = SharedMemory(create=True, size=max(1, _shared_blocks(spec)[1]))
+    
+    try:
+        views = _shared_views(shm, spec)
+        for code, (offset, length) in layout.items():
+            for key in views:
+                views[key][offset:offset + length] = panels[code][key]
+        # 뷰가 남아 있으면 close()가 실패하므로 바로 해제
+        del views
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    
+    return shm, spec, layout
+
+
+def _attach_shared_panels(name, spec):
+    """워커 프로세스 초기화: 부모가 만든 공유 메모리에 연결 (프로세스 종료 시까지 유지)"""
+    shm = SharedMemory(name=name)
+    _shared_panels['shm'] = shm
+    _shared_panels['views'] = _shared_views(shm, spec)
+
+
+def _screen_shared(args):
+    """공유 메모리의 (offset, length) 구간으로 종목 패널을 복원해 _screen_one 호출"""
+    stock_info, location, *options = args
+    
+    panel = None
+    if location is not None:
+        offset, length = location
+        panel = {key: view[offset:offset + length] for key, view in _shared_panels['views'].items()}
+    
+    return _screen_one((stock_info, panel, *options))
 
 
 def save_results(results, start_date, end_date):
@@ -509,7 +866,7 @@ def save_results(results, start_date, end_date):
     output_file = f'{output_dir}/bollinger_volume_{start_date}_{end_date}.csv'
     
     # 신호일 기준으로 정렬
-    sorted_results = sorted(results, key=lambda x: x['signal_date'])
+    sorted_results = sorted(results, key=lambda x: x.signal_date)
     
     if not sorted_results:
         with open(output_file, 'w', encoding='utf-8-sig', newline='') as f:
@@ -523,7 +880,8 @@ def save_results(results, start_date, end_date):
         print(f"{'='*60}")
         return
     
-    with open(output_file, 'w', encoding='utf-8-sig', newline='') as f:
+    # 행을 모아 한 번에 기록 (1MiB 버퍼로 write 호출 횟수 축소)
+    with open(output_file, 'w', encoding='utf-8-sig', newline='', buffering=1 << 20) as f:
         writer = csv.writer(f)
         writer.writerow(['전략', 'Bollinger Bands + Volume Strategy'])
         writer.writerow(['분석기간', f'{start_date} ~ {end_date}'])
@@ -531,7 +889,7 @@ def save_results(results, start_date, end_date):
         writer.writerow(['선택종목수', str(len(sorted_results))])
         writer.writerow([])
         
-        if 'backtest' in sorted_results[0]:
+        if sorted_results[0].backtest is not None:
             headers = [
                 '신호일', '종목코드', '종목명', 'BB터치일', '진입가', '현재가', '수익률(%)',
                 'BB위치(%)', '거래량비율', 'RSI', 'MACD', 'Signal',
@@ -548,29 +906,30 @@ def save_results(results, start_date, end_date):
         
         writer.writerow(headers)
         
+        rows = []
         for stock in sorted_results:
             row = [
-                stock['signal_date'],
-                stock['code'],
-                stock['name'],
-                stock['bb_touch_date'],
-                stock['entry_price'],
-                stock['current_price'],
-                stock['profit_rate'],
-                stock['bb_position'],
-                stock['volume_ratio'],
-                stock['rsi_value'],
-                stock['macd_value'],
-                stock['macd_signal'],
-                stock['stop_loss'],
-                stock['stop_loss_pct'],
-                stock['take_profit'],
-                stock['take_profit_pct'],
-                stock['support_low']
+                stock.signal_date,
+                stock.code,
+                stock.name,
+                stock.bb_touch_date,
+                stock.entry_price,
+                stock.current_price,
+                stock.profit_rate,
+                stock.bb_position,
+                stock.volume_ratio,
+                stock.rsi_value,
+                stock.macd_value,
+                stock.macd_signal,
+                stock.stop_loss,
+                stock.stop_loss_pct,
+                stock.take_profit,
+                stock.take_profit_pct,
+                stock.support_low
             ]
             
-            if 'backtest' in stock:
-                bt = stock['backtest']
+            if stock.backtest is not None:
+                bt = stock.backtest
                 row.extend([
                     bt['entry_date'],
                     bt['entry_price'],
@@ -580,14 +939,16 @@ def save_results(results, start_date, end_date):
                     bt['profit_rate']
                 ])
             
-            writer.writerow(row)
+            rows.append(row)
+        
+        writer.writerows(rows)
     
     print(f"\n{'='*60}")
     print(f"✓ 결과 저장 완료: {output_file}")
     print(f"{'='*60}")
 
 
-def backtest_stocks(results, trading_days, end_date, silent=False):
+def backtest_stocks(results, panels, end_date, silent=False):
     """백테스팅: 익일 시가 매수 후 손절/익절 도달 여부 확인"""
     if not silent:
         print(f"\n{'='*80}")
@@ -597,83 +958,60 @@ def backtest_stocks(results, trading_days, end_date, silent=False):
     backtested_results = []
     
     for stock in results:
-        stock_code = stock['code']
-        stock_name = stock['name']
-        signal_date = stock['signal_date']
-        entry_price = stock['entry_price']
-        stop_loss = stock['stop_loss']
-        take_profit = stock['take_profit']
-        
-        # 해당 종목의 시계열 데이터 추출
-        stock_data = []
-        for day in trading_days:
-            if day['is_holiday']:
-                continue
-            stock_info = next((s for s in day['stocks'] if s['code'] == stock_code), None)
-            if stock_info:
-                stock_data.append({
-                    'date': day['date'],
-                    'open': stock_info['open'],
-                    'high': stock_info['high'],
-                    'low': stock_info['low'],
-                    'close': stock_info['close']
-                })
-        
-        # 신호 발생일 찾기
-        signal_index = next((i for i, d in enumerate(stock_data) if d['date'] == signal_date), None)
-        
-        if signal_index is None or signal_index >= len(stock_data) - 1:
+        stock_code = stock.code
+        stock_name = stock.name
+        signal_date = stock.signal_date
+        entry_price = stock.entry_price
+        stop_loss = stock.stop_loss
+        take_profit = stock.take_profit
+        
+        # 해당 종목의 시계열 배열 (종목별 패널은 일자순 정렬, 가격은 원 단위 정수)
+        panel = panels.get(stock_code)
+        if panel is None:
             continue
+        dates = panel['date']
+        opens, highs, lows, closes = panel['open'], panel['high'], panel['low'], panel['close']
         
-        # 익일 시가로 매수
-        buy_index = signal_index + 1
-        buy_price = stock_data[buy_index]['open']
-        buy_date = stock_data[buy_index]['date']
+        # 신호 발생일 찾기 (정렬된 일자 배열에서 이진 탐색)
+        signal_index = int(np.searchsorted(dates, signal_date))
         
-        # 손절가/익절가 도달 여부 확인
-        sell_date = None
-        sell_price = None
-        sell_reason = None
+        if signal_index >= len(dates) - 1 or dates[signal_index] != signal_date:
+            continue
         
-        for i in range(buy_index, len(stock_data)):
-            day_data = stock_data[i]
-            
-            # 당일 저가가 손절가 이하로 떨어졌는지 확인
-            if day_data['low'] <= stop_loss:
-                sell_date = day_data['date']
-                sell_price = stop_loss
-                sell_reason = '손절'
-                break
-            
-            # 당일 고가가 익절가 이상으로 올랐는지 확인
-            if day_data['high'] >= take_profit:
-                sell_date = day_data['date']
-                sell_price = take_profit
-                sell_reason = '익절'
-                break
-        
-        # 매도하지 않았다면 홀딩
-        if sell_date is None:
-            current_price = stock_data[-1]['close']
-            sell_date = stock_data[-1]['date']
-            sell_price = current_price
+        # 익일 시가로 매수
+        buy_index = signal_index + 1
+        buy_price = int(opens[buy_index])
+        buy_date = str(dates[buy_index])
+        
+        # 손절가/익절가 최초 도달일 (같은 날 둘 다 도달하면 손절 우선)
+        exit_idx, exit_code = _walk_exit(lows, highs, buy_index, stop_loss, take_profit)
+        
+        if exit_code == 2:
+            sell_date = str(dates[exit_idx])
+            sell_price = stop_loss
+            sell_reason = '손절'
+        elif exit_code == 1:
+            sell_date = str(dates[exit_idx])
+            sell_price = take_profit
+            sell_reason = '익절'
+        else:
+            # 매도하지 않았다면 홀딩
+            sell_date = str(dates[-1])
+            sell_price = int(closes[-1])
             sell_reason = '홀딩'
         
         # 수익률 계산
         profit_rate = ((sell_price - buy_price) / buy_price) * 100 if buy_price != 0 else 0
         
-        backtested_results.append({
-            **stock,
-            'backtest': {
-                'buy_date': buy_date,
-                'buy_price': int(buy_price),
-                'sell_date': sell_date,
-                'sell_price': int(sell_price),
-                'sell_reason': sell_reason,
-                'profit_rate': round(profit_rate, 2),
-                'days_held': len([d for d in stock_data[buy_index:] if d['date'] <= sell_date])
-            }
-        })
+        backtested_results.append(replace(stock, backtest={
+            'buy_date': buy_date,
+            'buy_price': int(buy_price),
+            'sell_date': sell_date,
+            'sell_price': int(sell_price),
+            'sell_reason': sell_reason,
+            'profit_rate': round(profit_rate, 2),
+            'days_held': int(np.count_nonzero(dates[buy_index:] <= sell_date))
+        }))
         
         if not silent:
             status_icon = '✅' if sell_reason == '익절' else '❌' if sell_reason == '손절' else '⏳'
@@ -701,13 +1039,13 @@ def print_final_summary(results, silent=False):
         print("-" * 75)
         
         for stock in results:
-            name = stock['name'][:10] + '..' if len(stock['name']) > 12 else stock['name']
-            print(f"{name:<12} {stock['code']:<8} "
-                  f"{stock['signal_date']:<10} "
-                  f"{stock['bb_touch_date']:<10} "
-                  f"{stock['volume_ratio']:>7.1f}배 "
-                  f"{stock['rsi_value']:>6.1f} "
-                  f"{stock['bb_position']:>7.1f}%")
+            name = stock.name[:10] + '..' if len(stock.name) > 12 else stock.name
+            print(f"{name:<12} {stock.code:<8} "
+                  f"{stock.signal_date:<10} "
+                  f"{stock.bb_touch_date:<10} "
+                  f"{stock.volume_ratio:>7.1f}배 "
+                  f"{stock.rsi_value:>6.1f} "
+                  f"{stock.bb_position:>7.1f}%")
         
         # 매매 전략 테이블
         print(f"\n[매매 전략 (손절/익절)]")
@@ -715,25 +1053,25 @@ def print_final_summary(results, silent=False):
         print("-" * 95)
         
         for stock in results:
-            name = stock['name'][:10] + '..' if len(stock['name']) > 12 else stock['name']
+            name = stock.name[:10] + '..' if len(stock.name) > 12 else stock.name
             print(f"{name:<12} "
-                  f"{stock['entry_price']:>10,}원 "
-                  f"{stock['current_price']:>10,}원 "
-                  f"{stock['profit_rate']:>7.2f}% "
-                  f"{stock['stop_loss']:>10,}원 "
-                  f"{stock['stop_loss_pct']:>7.2f}% "
-                  f"{stock['take_profit']:>10,}원 "
-                  f"{stock['take_profit_pct']:>7.2f}%")
+                  f"{stock.entry_price:>10,}원 "
+                  f"{stock.current_price:>10,}원 "
+                  f"{stock.profit_rate:>7.2f}% "
+                  f"{stock.stop_loss:>10,}원 "
+                  f"{stock.stop_loss_pct:>7.2f}% "
+                  f"{stock.take_profit:>10,}원 "
+                  f"{stock.take_profit_pct:>7.2f}%")
         
         # 백테스팅 결과 테이블 (있는 경우)
-        if results and 'backtest' in results[0]:
+        if results and results[0].backtest is not None:
             print(f"\n[백테스팅 결과]")
             print(f"{'종목명':<12} {'매수일':>10} {'매수가':>10} {'매도일':>10} {'매도가':>10} {'결과':>8} {'수익률':>8} {'보유일':>6}")
             print("-" * 90)
             
             for stock in results:
-                name = stock['name'][:10] + '..' if len(stock['name']) > 12 else stock['name']
-                bt = stock['backtest']
+                name = stock.name[:10] + '..' if len(stock.name) > 12 else stock.name
+                bt = stock.backtest
                 result_icon = '✅익절' if bt['sell_reason'] == '익절' else '❌손절' if bt['sell_reason'] == '손절' else '⏳홀딩'
                 print(f"{name:<12} "
                       f"{bt['buy_date']:>10} "
@@ -746,27 +1084,27 @@ def print_final_summary(results, silent=False):
         
         # 통계 정보
         print(f"\n[통계 정보]")
-        print(f"  - 평균 거래량 비율: {sum(s['volume_ratio'] for s in results) / len(results):.2f}배")
-        print(f"  - 평균 RSI: {sum(s['rsi_value'] for s in results) / len(results):.1f}")
-        print(f"  - 평균 BB 위치: {sum(s['bb_position'] for s in results) / len(results):.1f}%")
-        print(f"  - 평균 진입가: {sum(s['entry_price'] for s in results) / len(results):,.0f}원")
-        print(f"  - 평균 현재가: {sum(s['current_price'] for s in results) / len(results):,.0f}원")
-        print(f"  - 평균 수익률: {sum(s['profit_rate'] for s in results) / len(results):+.2f}%")
+        print(f"  - 평균 거래량 비율: {sum(s.volume_ratio for s in results) / len(results):.2f}배")
+        print(f"  - 평균 RSI: {sum(s.rsi_value for s in results) / len(results):.1f}")
+        print(f"  - 평균 BB 위치: {sum(s.bb_position for s in results) / len(results):.1f}%")
+        print(f"  - 평균 진입가: {sum(s.entry_price for s in results) / len(results):,.0f}원")
+        print(f"  - 평균 현재가: {sum(s.current_price for s in results) / len(results):,.0f}원")
+        print(f"  - 평균 수익률: {sum(s.profit_rate for s in results) / len(results):+.2f}%")
     
     # 개별 종목 상세 정보
     print(f"\n[종목별 상세 정보]")
     for idx, stock in enumerate(results, 1):
-        print(f"\n{idx}. {stock['name']} ({stock['code']})")
-        print(f"   신호 발생일: {stock['signal_date']} | BB 하단 터치일: {stock['bb_touch_date']}")
-        print(f"   진입가: {stock['entry_price']:,}원 | 현재가: {stock['current_price']:,}원 | 수익률: {stock['profit_rate']:+.2f}%")
-        print(f"   거래량: 평균의 {stock['volume_ratio']:.1f}배 | RSI: {stock['rsi_value']:.1f} | BB위치: {stock['bb_position']:.1f}%")
-        print(f"   💔 손절가: {stock['stop_loss']:,}원 ({stock['stop_loss_pct']:+.2f}%)")
-        print(f"   💰 익절가: {stock['take_profit']:,}원 ({stock['take_profit_pct']:+.2f}%)")
-        print(f"   📊 손익비: 1:{stock['risk_reward_ratio']:.0f}")
+        print(f"\n{idx}. {stock.name} ({stock.code})")
+        print(f"   신호 발생일: {stock.signal_date} | BB 하단 터치일: {stock.bb_touch_date}")
+        print(f"   진입가: {stock.entry_price:,}원 | 현재가: {stock.current_price:,}원 | 수익률: {stock.profit_rate:+.2f}%")
+        print(f"   거래량: 평균의 {stock.volume_ratio:.1f}배 | RSI: {stock.rsi_value:.1f} | BB위치: {stock.bb_position:.1f}%")
+        print(f"   💔 손절가: {stock.stop_loss:,}원 ({stock.stop_loss_pct:+.2f}%)")
+        print(f"   💰 익절가: {stock.take_profit:,}원 ({stock.take_profit_pct:+.2f}%)")
+        print(f"   📊 손익비: 1:{stock.risk_reward_ratio:.0f}")
         
         # 백테스팅 정보 (있는 경우)
-        if 'backtest' in stock:
-            bt = stock['backtest']
+        if stock.backtest is not None:
+            bt = stock.backtest
             result_text = f"{'✅ 익절' if bt['sell_reason'] == '익절' else '❌ 손절' if bt['sell_reason'] == '손절' else '⏳ 홀딩'}"
             print(f"   🔍 백테스트: {bt['buy_date']}({bt['buy_price']:,}원) → {bt['sell_date']}({bt['sell_price']:,}원) "
                   f"| {result_text} | {bt['profit_rate']:+.2f}% | {bt['days_held']}일 보유")
@@ -809,6 +1147,7 @@ def main():
     parser.add_argument('--low_period', type=int, default=20, help='전저점 계산 기간 (일, 기본값: 20, 권장: 20-30)')
     parser.add_argument('--silent', action='store_true', help='간략 출력 모드 (최종 결과만 표시)')
     parser.add_argument('--debug', action='store_true', help='디버그 모드 (각 조건별 통과율 표시)')
+    parser.add_argument('--workers', type=int, default=1, help='종목 검사 병렬 프로세스 수 (기본값: 1, 순차 처리 / 0: CPU 코어 수)')
     
     args = parser.parse_args()
     
@@ -845,19 +1184,19 @@ def main():
         print(f"데이터 로드 기간: {extended_start} ~ {end_date} (기술적 지표 계산용)\n")
     
     # 데이터 로드
-    trading_days = DataLoader.load_kospi200_data(extended_start, end_date)
+    panel = DataLoader.load_kospi200_data(extended_start, end_date)
     
-    if trading_days is None:
+    if panel is None:
         sys.exit(1)
     
-    if not args.silent:
-        print(f"✓ 로드된 거래일: {len(trading_days)}일")
-        print(f"  첫 거래일: {trading_days[0]['date']}")
-        print(f"  마지막 거래일: {trading_days[-1]['date']}")
-        print(f"  종목 수: {len(trading_days[-1]['stocks'])}개\n")
-    
     # 종목 선별
-    screener = StockScreener(trading_days, silent=args.silent)
+    screener = StockScreener(panel, silent=args.silent)
+    
+    if not args.silent:
+        print(f"✓ 로드된 거래일: {len(panel['date'])}일")
+        print(f"  첫 거래일: {panel['date'][0]}")
+        print(f"  마지막 거래일: {panel['date'][-1]}")
+        print(f"  종목 수: {len(screener.all_stocks)}개\n")
     
     if not args.silent:
         print(f"검색 범위: {start_date} ~ {end_date}")
@@ -867,7 +1206,8 @@ def main():
         start_date=start_date,
         end_date=end_date,
         low_period=args.low_period,
-        debug=args.debug
+        debug=args.debug,
+        workers=args.workers
     )
     
     if not selected_stocks:
@@ -877,7 +1217,7 @@ def main():
     
     # 백테스팅 실행 (옵션이 주어진 경우)
     if args.backtest:
-        backtested_stocks = backtest_stocks(selected_stocks, trading_days, end_date, silent=args.silent)
+        backtested_stocks = backtest_stocks(selected_stocks, screener.panels, end_date, silent=args.silent)
         
         # 최종 결과 출력 (백테스팅 포함)
         print_final_summary(backtested_stocks, silent=args.silent)
@@ -888,11 +1228,13 @@ def main():
         print(f"{'='*80}")
         
         total = len(backtested_stocks)
-        profit_count = len([s for s in backtested_stocks if s['backtest']['sell_reason'] == '익절'])
-        loss_count = len([s for s in backtested_stocks if s['backtest']['sell_reason'] == '손절'])
-        hold_count = len([s for s in backtested_stocks if s['backtest']['sell_reason'] == '홀딩'])
+        # 청산 사유별 개수를 한 번의 순회로 집계
+        reason_counts = Counter(s.backtest['sell_reason'] for s in backtested_stocks)
+        profit_count = reason_counts['익절']
+        loss_count = reason_counts['손절']
+        hold_count = reason_counts['홀딩']
         
-        avg_profit = sum(s['backtest']['profit_rate'] for s in backtested_stocks) / total if total > 0 else 0
+        avg_profit = sum(s.backtest['profit_rate'] for s in backtested_stocks) / total if total > 0 else 0
         win_rate = (profit_count / total * 100) if total > 0 else 0
         
         print(f"총 종목: {total}개")
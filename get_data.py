@@ -1,7 +1,10 @@
-import requests
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from pykrx import stock
 import json
 import os
@@ -10,6 +13,47 @@ import argparse
 import sys
 warnings.filterwarnings('ignore')
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+PYKRX_MIN_INTERVAL = 0.05  # pykrx(KRX 스크래핑) 요청 간 최소 간격 (초, 스레드 간 공유)
+
+
+def parse_ymd(date_str):
+    """저장 데이터의 'YYYYMMDD' 문자열을 date로 변환 (strptime보다 가벼운 정수 변환)"""
+    return date(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:8]))
+
+
+@lru_cache(maxsize=4096)
+def _ticker_name(stock_code):
+    """종목명 조회 (pykrx 원격 조회 결과를 프로세스 내에서 재사용)"""
+    return stock.get_market_ticker_name(stock_code)
+
+
+@lru_cache(maxsize=4096)
+def _index_has_data(target_date):
+    """KOSPI 지수 시세 존재 여부 (조회 실패는 캐시하지 않도록 예외를 그대로 전달)"""
+    return not stock.get_index_ohlcv(target_date, target_date, "1001").empty
+
+
+def write_json(file_path, data):
+    """JSON 파일 저장 (orjson이 설치되어 있으면 bytes로 직렬화, 들여쓰기 2칸 형식은 동일)"""
+    if orjson:
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def read_json(file_path):
+    """JSON 파일 로드 (orjson이 설치되어 있으면 orjson으로 파싱)"""
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
 
 class KISAPIClient:
     """한국투자증권 API 클라이언트"""
@@ -27,6 +71,9 @@ class KISAPIClient:
             print("💰 실전투자 모드")
 
         self.access_token = None
+        # pykrx 요청 간격 제한 (여러 스레드가 동시에 조회해도 KRX에 과부하가 가지 않도록)
+        self._rate_lock = threading.Lock()
+        self._next_call = 0.0
 
         if not app_key or not app_secret or not account_no:
             raise ValueError("APP_KEY, APP_SECRET, ACCOUNT_NO는 필수입니다.")
@@ -40,11 +87,10 @@ class KISAPIClient:
         """KOSPI 200 종목 코드 조회 (캐싱 지원)"""
         if use_cache and os.path.exists(cache_file):
             try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cached_data = json.load(f)
-                    print(f"✓ 캐시 파일에서 KOSPI 200 종목 {len(cached_data['stocks'])}개 로드 완료")
-                    print(f"  캐시 생성일: {cached_data['created_at']}")
-                    return cached_data['stocks']
+                cached_data = read_json(cache_file)
+                print(f"✓ 캐시 파일에서 KOSPI 200 종목 {len(cached_data['stocks'])}개 로드 완료")
+                print(f"  캐시 생성일: {cached_data['created_at']}")
+                return cached_data['stocks']
             except Exception as e:
                 print(f"⚠️ 캐시 파일 읽기 실패: {e}")
                 print("  새로 종목 코드를 가져옵니다...")
@@ -52,13 +98,15 @@ class KISAPIClient:
         try:
             stock_codes = stock.get_index_portfolio_deposit_file("1028")
 
-            stocks = []
-            for code in stock_codes:
-                name = stock.get_market_ticker_name(code)
-                stocks.append({
-                    'code': code,
-                    'name': name
-                })
+            def fetch_name(code):
+                self._throttle()
+                return _ticker_name(code)
+
+            # 종목명 조회는 종목마다 원격 요청이므로 스레드 풀로 동시에 조회 (순서 유지, 요청 간격은 _throttle로 제한)
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                names = list(executor.map(fetch_name, stock_codes))
+
+            stocks = [{'code': code, 'name': name} for code, name in zip(stock_codes, names)]
 
             print(f"✓ KOSPI 200 종목 {len(stocks)}개 로드 완료")
 
@@ -68,8 +116,7 @@ class KISAPIClient:
                         'created_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                         'stocks': stocks
                     }
-                    with open(cache_file, 'w', encoding='utf-8') as f:
-                        json.dump(cache_data, f, ensure_ascii=False, indent=2)
+                    write_json(cache_file, cache_data)
                     print(f"✓ 종목 코드를 '{cache_file}'에 저장했습니다.")
                 except Exception as e:
                     print(f"⚠️ 캐시 파일 저장 실패: {e}")
@@ -79,10 +126,30 @@ class KISAPIClient:
             print(f"❌ KOSPI 200 종목 코드 조회 실패: {e}")
             return []
 
+    def _throttle(self):
+        """pykrx 호출 간격을 PYKRX_MIN_INTERVAL초 이상으로 유지 (스레드 간 공유)"""
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_call - now
+            self._next_call = max(now, self._next_call) + PYKRX_MIN_INTERVAL
+        if wait > 0:
+            time.sleep(wait)
+
+    def get_market_data_pykrx(self, target_date):
+        """pykrx를 이용한 특정일 KOSPI 전체 종목 시세 조회 (수정주가 미적용, 종목코드 인덱스, 조회 실패 시 None)"""
+        try:
+            return stock.get_market_ohlcv_by_ticker(target_date, market="KOSPI")
+        except Exception as e:
+            return None
+
     def get_historical_data_pykrx(self, stock_code, target_date):
-        """pykrx를 이용한 특정일 데이터 조회"""
+        """pykrx를 이용한 특정일 데이터 조회
+
+        전체 종목 조회(get_market_ohlcv_by_ticker)와 같은 기준이 되도록 수정주가를 적용하지 않은 시세와 거래대금을 받는다.
+        """
+        self._throttle()
         try:
-            df = stock.get_market_ohlcv(target_date, target_date, stock_code)
+            df = stock.get_market_ohlcv(target_date, target_date, stock_code, adjusted=False)
             if df.empty:
                 return None
             return df
@@ -101,25 +168,64 @@ class DataCollector:
         return f"data/json/kospi200/{year}/kospi200_data.json"
 
     def is_trading_day(self, target_date):
-        """거래일인지 확인"""
+        """거래일인지 확인 (같은 날짜는 한 번만 조회)"""
         try:
             # KOSPI 지수로 거래일 확인
-            df = stock.get_index_ohlcv(target_date, target_date, "1001")
-            return not df.empty
+            return _index_has_data(target_date)
         except:
             return False
 
-    def collect_data_for_date(self, stock_codes, target_date):
-        """특정 날짜의 KOSPI 200 전체 종목 데이터 수집"""
+    @staticmethod
+    def make_stock_record(stock_info, row):
+        """pykrx 시세 행(Series 또는 dict)을 저장용 종목 데이터로 변환"""
+        return {
+            'code': stock_info['code'],
+            'name': stock_info['name'],
+            'open': int(row['시가']),
+            'high': int(row['고가']),
+            'low': int(row['저가']),
+            'close': int(row['종가']),
+            'volume': int(row['거래량']),
+            'value': int(row['거래대금']) if '거래대금' in row else 0
+        }
+
+    def fetch_stock_data(self, stock_info, target_date):
+        """단일 종목의 특정일 시세 조회 (데이터가 없거나 에러 발생 시 None)"""
+        try:
+            df = self.api.get_historical_data_pykrx(stock_info['code'], target_date)
+
+            if df is None or df.empty:
+                return None
+
+            # 데이터 추출
+            return self.make_stock_record(stock_info, df.iloc[0])
+
+        except Exception as e:
+            # 에러 발생 시 해당 종목은 건너뛰기
+            return None
+
+    def collect_data_for_date(self, stock_codes, target_date, max_workers=4, code_set=None):
+        """특정 날짜의 KOSPI 200 전체 종목 데이터 수집 (종목별 조회 시 max_workers개 스레드로 동시 조회)
+
+        code_set: 종목코드 frozenset (여러 날짜를 수집할 때 한 번만 만들어 전달, 없으면 stock_codes로 생성)
+        """
         date_str = target_date
-        date_obj = datetime.strptime(target_date, "%Y%m%d")
+        date_obj = parse_ymd(target_date)
         
         print(f"\n{'='*60}")
         print(f"📅 데이터 수집 날짜: {date_obj.strftime('%Y-%m-%d')} ({date_obj.strftime('%A')})")
         print(f"{'='*60}")
 
-        # 거래일 확인
-        if not self.is_trading_day(target_date):
+        # 전체 KOSPI 종목 시세를 한 번의 요청으로 조회 (실패하면 종목별 조회로 대체)
+        df_all = self.api.get_market_data_pykrx(target_date)
+
+        # 거래일 확인 (전체 조회 결과가 비어 있거나 거래량이 모두 0이면 휴장일)
+        if df_all is not None:
+            is_holiday = df_all.empty or not df_all['거래량'].any()
+        else:
+            is_holiday = not self.is_trading_day(target_date)
+
+        if is_holiday:
             print(f"⚠️  {target_date}는 휴장일입니다.")
             return {
                 'date': target_date,
@@ -135,41 +241,32 @@ class DataCollector:
         print(f"📊 총 {total}개 종목 데이터 수집 시작...")
         print("-" * 60)
 
-        for idx, stock_info in enumerate(stock_codes, 1):
-            try:
-                if idx % 50 == 0:
-                    print(f"진행중: {idx}/{total} ({idx/total*100:.1f}%)")
-
-                stock_code = stock_info['code']
-                stock_name = stock_info['name']
-
-                # API 호출 간격 (과부하 방지)
-                time.sleep(0.05)
+        if df_all is not None:
+            # 전체 시세에서 KOSPI 200 종목만 골라 종목 목록 순서대로 변환
+            if code_set is None:
+                code_set = frozenset(stock_info['code'] for stock_info in stock_codes)
+            rows = df_all.loc[df_all.index.isin(code_set)].to_dict('index')
 
-                df = self.api.get_historical_data_pykrx(stock_code, target_date)
-                
-                if df is None or df.empty:
+            for stock_info in stock_codes:
+                row = rows.get(stock_info['code'])
+                if row is None:
                     continue
+                try:
+                    results.append(self.make_stock_record(stock_info, row))
+                except Exception as e:
+                    # 에러 발생 시 해당 종목은 건너뛰기
+                    continue
+        else:
+            # 종목별 조회는 서로 독립적인 네트워크 대기이므로 스레드 풀로 동시에 요청 (결과는 종목 순서 유지)
+            # 요청 시작 간격은 KISAPIClient._throttle이 스레드 간 공유로 제한
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                fetched = executor.map(lambda stock_info: self.fetch_stock_data(stock_info, target_date), stock_codes)
+                for idx, result in enumerate(fetched, 1):
+                    if idx % 50 == 0:
+                        print(f"진행중: {idx}/{total} ({idx/total*100:.1f}%)")
 
-                # 데이터 추출
-                row = df.iloc[0]
-                
-                result = {
-                    'code': stock_code,
-                    'name': stock_name,
-                    'open': int(row['시가']),
-                    'high': int(row['고가']),
-                    'low': int(row['저가']),
-                    'close': int(row['종가']),
-                    'volume': int(row['거래량']),
-                    'value': int(row['거래대금']) if '거래대금' in row else 0
-                }
-                
-                results.append(result)
-
-            except Exception as e:
-                # 에러 발생 시 해당 종목은 건너뛰기
-                continue
+                    if result is not None:
+                        results.append(result)
 
         print(f"\n✓ 데이터 수집 완료: {len(results)}/{total}개 종목")
 
@@ -202,8 +299,7 @@ class DataCollector:
                     'data': year_data
                 }
 
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(output, f, ensure_ascii=False, indent=2)
+                write_json(output_file, output)
 
                 trading_days = sum(1 for d in year_data if not d['is_holiday'])
                 holidays = len(year_data) - trading_days
@@ -224,8 +320,7 @@ def load_existing_data_by_year(year):
         return None
     
     try:
-        with open(output_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return read_json(output_file)
     except Exception as e:
         print(f"⚠️ {year}년 파일 로드 실패: {e}")
         return None
@@ -283,12 +378,17 @@ def merge_data_by_year(new_data):
             existing_dates = {d['date'] for d in existing_data['data']}
             
             # 중복되지 않은 신규 데이터만 추가
-            for new_entry in year_new_data:
-                if new_entry['date'] not in existing_dates:
-                    existing_data['data'].append(new_entry)
+            added = [new_entry for new_entry in year_new_data if new_entry['date'] not in existing_dates]
+            
+            # 추가할 날짜가 없으면 연도 파일을 다시 쓰지 않음 (파일 수정 시각이 유지되어 패널 캐시도 재사용)
+            if not added:
+                print(f"\n✓ {year}년: 추가할 신규 날짜가 없어 기존 파일을 유지합니다: {output_file}")
+                continue
+            
+            existing_data['data'].extend(added)
             
             # 날짜순 정렬
-            existing_data['data'].sort(key=lambda x: x['date'])
+            existing_data['data'].sort(key=itemgetter('date'))
             
             # 메타데이터 업데이트
             existing_data['generated_at'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -299,13 +399,12 @@ def merge_data_by_year(new_data):
                 'year': year,
                 'generated_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                 'total_days': len(year_new_data),
-                'data': sorted(year_new_data, key=lambda x: x['date'])
+                'data': sorted(year_new_data, key=itemgetter('date'))
             }
         
         # 저장
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(existing_data, f, ensure_ascii=False, indent=2)
+        write_json(output_file, existing_data)
         
         trading_days = sum(1 for d in existing_data['data'] if not d['is_holiday'])
         holidays = existing_data['total_days'] - trading_days
@@ -362,7 +461,7 @@ def main():
         print(f"✓ 기존 데이터 마지막 날짜: {last_date}")
         
         # 마지막 날짜 다음날부터 어제까지
-        start_date = (datetime.strptime(last_date, "%Y%m%d") + timedelta(days=1)).strftime("%Y%m%d")
+        start_date = (parse_ymd(last_date) + timedelta(days=1)).strftime("%Y%m%d")
         end_date = (datetime.now() - timedelta(days=1)).strftime("%Y%m%d")
         
         if start_date > end_date:
@@ -386,11 +485,7 @@ def main():
         start = datetime.strptime(args.from_date, "%Y%m%d")
         end = datetime.strptime(args.to_date, "%Y%m%d") if args.to_date else start
 
-        date_list = []
-        current = start
-        while current <= end:
-            date_list.append(current.strftime("%Y%m%d"))
-            current += timedelta(days=1)
+        date_list = [(start + timedelta(days=i)).strftime("%Y%m%d") for i in range((end - start).days + 1)]
 
         print(f"\n📅 데이터 수집 기간: {args.from_date} ~ {end.strftime('%Y%m%d')}")
         print(f"   총 {len(date_list)}일 처리 예정\n")
@@ -449,9 +544,10 @@ def main():
     # 데이터 수집
     collector = DataCollector(api)
     all_data = []
+    kospi200_codes = frozenset(s['code'] for s in kospi200_stocks)
 
     for target_date in date_list:
-        date_data = collector.collect_data_for_date(kospi200_stocks, target_date)
+        date_data = collector.collect_data_for_date(kospi200_stocks, target_date, code_set=kospi200_codes)
         all_data.append(date_data)
         time.sleep(0.5)  # 날짜 간 대기
 
@@ -5,116 +5,146 @@ import argparse
 import csv
 from datetime import datetime, timedelta
 import pandas as pd
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _ema_loop(values, period, multiplier, out):
+    """EMA 점화식을 out[period-1:]에 기록 (첫 값은 period일 단순평균, numba 설치 시 JIT 컴파일)"""
+    total = 0.0
+    for i in range(period):
+        total += values[i]
+    out[period - 1] = total / period
+    for i in range(period, values.shape[0]):
+        out[i] = (values[i] - out[i - 1]) * multiplier + out[i - 1]
+
+
+def _rsi_loop(gains, losses, period, out):
+    """Wilder 평활 RSI를 out[1:]에 기록 (numba 설치 시 JIT 컴파일)"""
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(period):
+        avg_gain += gains[i]
+        avg_loss += losses[i]
+    avg_gain /= period
+    avg_loss /= period
+    
+    out[1] = 100.0 if avg_loss == 0 else 100 - (100 / (1 + avg_gain / avg_loss))
+    for i in range(period, gains.shape[0]):
+        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+        out[i - period + 2] = 100.0 if avg_loss == 0 else 100 - (100 / (1 + avg_gain / avg_loss))
+
+
+if njit is not None:
+    _ema_loop = njit(cache=True)(_ema_loop)
+    _rsi_loop = njit(cache=True)(_rsi_loop)
+
 
 class TechnicalIndicators:
-    """기술적 지표 계산 클래스"""
+    """기술적 지표 계산 클래스
+    
+    입력은 리스트나 ndarray를 받아 float64 ndarray로 반환하며 계산 불가 구간은 NaN으로 채운다.
+    """
     
     @staticmethod
     def calculate_ema(prices, period):
         """EMA (Exponential Moving Average) 계산"""
-        if len(prices) < period:
-            return [None] * len(prices)
+        values = np.asarray(prices, dtype=np.float64)
+        result = np.full(len(values), np.nan)
+        if len(values) < period:
+            return result
         
-        ema_values = []
         multiplier = 2 / (period + 1)
         
-        # 첫 EMA는 SMA로 시작
-        sma = sum(prices[:period]) / period
-        ema_values.append(sma)
+        if njit is not None:
+            _ema_loop(values, period, multiplier, result)
+            return result
+        
+        # 첫 EMA는 SMA로 시작 (앞에서부터 차례로 더해 기존 리스트 구현과 같은 값)
+        ema = sum(values[:period].tolist()) / period
+        ema_values = [ema]
         
-        # 이후 EMA 계산
-        for i in range(period, len(prices)):
-            ema = (prices[i] - ema_values[-1]) * multiplier + ema_values[-1]
+        # 이후 EMA 계산 (점화식이라 스칼라 루프 유지)
+        for price in values[period:].tolist():
+            ema = (price - ema) * multiplier + ema
             ema_values.append(ema)
         
-        # 앞부분을 None으로 채움
-        return [None] * (period - 1) + ema_values
+        # 앞부분은 NaN
+        result[period - 1:] = ema_values
+        return result
     
     @staticmethod
     def calculate_macd(prices, fast=12, slow=26, signal=9):
         """MACD 계산 (MACD Line, Signal Line 반환)"""
         if len(prices) < slow + signal:
-            return [None] * len(prices), [None] * len(prices)
-        
-        # MACD Line 계산
-        fast_ema = TechnicalIndicators.calculate_ema(prices, fast)
-        slow_ema = TechnicalIndicators.calculate_ema(prices, slow)
-        
-        macd_line = []
-        for i in range(len(prices)):
-            if fast_ema[i] is not None and slow_ema[i] is not None:
-                macd_line.append(fast_ema[i] - slow_ema[i])
-            else:
-                macd_line.append(None)
-        
-        # Signal Line 계산 (MACD의 EMA)
-        valid_macd = [m for m in macd_line if m is not None]
-        if len(valid_macd) < signal:
-            return macd_line, [None] * len(prices)
+            return np.full(len(prices), np.nan), np.full(len(prices), np.nan)
         
-        signal_ema = TechnicalIndicators.calculate_ema(valid_macd, signal)
+        # MACD Line 계산 (어느 한쪽이 NaN이면 차이도 NaN)
+        macd_line = TechnicalIndicators.calculate_ema(prices, fast) - TechnicalIndicators.calculate_ema(prices, slow)
         
-        # None 부분 채우기
-        none_count = len([m for m in macd_line if m is None])
-        signal_line = [None] * none_count + signal_ema
+        # Signal Line 계산 (계산 가능한 MACD 구간의 EMA)
+        valid = ~np.isnan(macd_line)
+        signal_line = np.full(len(macd_line), np.nan)
+        signal_line[valid] = TechnicalIndicators.calculate_ema(macd_line[valid], signal)
         
         return macd_line, signal_line
     
     @staticmethod
     def calculate_rsi(prices, period=14):
-        """RSI 계산"""
-        if len(prices) < period + 1:
-            return [None] * len(prices)
+        """RSI 계산
         
-        deltas = [prices[i] - prices[i-1] for i in range(1, len(prices))]
-        gains = [d if d > 0 else 0 for d in deltas]
-        losses = [-d if d < 0 else 0 for d in deltas]
+        결과 배열의 길이와 인덱스 배치는 기존 리스트 구현과 같다:
+        [0]은 NaN, [1]부터 첫 RSI(period일 평균)와 이후 Wilder 평활 값 (길이 len(prices) - period + 1)
+        """
+        values = np.asarray(prices, dtype=np.float64)
+        if len(values) < period + 1:
+            return np.full(len(values), np.nan)
         
-        rsi_values = [None]  # 첫 번째는 None
+        deltas = np.diff(values)
+        gains = np.maximum(deltas, 0.0)
+        losses = np.maximum(-deltas, 0.0)
+        
+        if njit is not None:
+            result = np.full(len(gains) - period + 2, np.nan)
+            _rsi_loop(gains, losses, period, result)
+            return result
+        
+        gains = gains.tolist()
+        losses = losses.tolist()
+        
+        rsi_values = [np.nan]  # 첫 번째는 NaN
         
         # 첫 RSI 계산 (SMA 방식)
         avg_gain = sum(gains[:period]) / period
         avg_loss = sum(losses[:period]) / period
+        rsi_values.append(100.0 if avg_loss == 0 else 100 - (100 / (1 + avg_gain / avg_loss)))
         
-        if avg_loss == 0:
-            rsi = 100
-        else:
-            rs = avg_gain / avg_loss
-            rsi = 100 - (100 / (1 + rs))
-        rsi_values.append(rsi)
-        
-        # 이후 RSI 계산 (EMA 방식)
-        for i in range(period, len(gains)):
-            avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-            avg_loss = (avg_loss * (period - 1) + losses[i]) / period
-            
-            if avg_loss == 0:
-                rsi = 100
-            else:
-                rs = avg_gain / avg_loss
-                rsi = 100 - (100 / (1 + rs))
-            rsi_values.append(rsi)
+        # 이후 RSI 계산 (Wilder 평활, 점화식이라 스칼라 루프 유지)
+        for gain, loss in zip(gains[period:], losses[period:]):
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+            rsi_values.append(100.0 if avg_loss == 0 else 100 - (100 / (1 + avg_gain / avg_loss)))
         
-        return rsi_values
+        return np.array(rsi_values)
     
     @staticmethod
     def calculate_ma(prices, period):
         """이동평균 계산"""
-        if len(prices) < period:
-            return [None] * len(prices)
+        values = np.asarray(prices, dtype=np.float64)
+        result = np.full(len(values), np.nan)
+        if len(values) < period:
+            return result
         
-        ma_values = []
-        for i in range(len(prices)):
-            if i < period - 1:
-                ma_values.append(None)
-            else:
-                ma = sum(prices[i-period+1:i+1]) / period
-                ma_values.append(ma)
-        
-        return ma_values
+        result[period - 1:] = sliding_window_view(values, period).mean(axis=1)
+        return result
 
 
 class DataLoader:
@@ -172,15 +202,22 @@ class DataLoader:
         return sorted(trading_days, key=lambda x: x['date'])
     
     @staticmethod
-    def get_stock_timeseries(trading_days, stock_code):
-        """특정 종목의 시계열 데이터 추출"""
-        timeseries = []
+    def build_timeseries_index(trading_days):
+        """전체 거래일을 한 번 순회해 종목코드별 시계열 데이터 생성
+        
+        종목마다 모든 거래일의 종목 목록을 선형 탐색하지 않도록 {종목코드: 시계열 리스트}로 모아 둔다.
+        """
+        timeseries_by_code = {}
         
         for day in trading_days:
-            stock = next((s for s in day['stocks'] if s['code'] == stock_code), None)
-            if stock:
-                timeseries.append({
-                    'date': day['date'],
+            date = day['date']
+            seen = set()
+            for stock in day['stocks']:
+                if stock['code'] in seen:
+                    continue  # 같은 날 중복 항목은 첫 번째만 사용
+                seen.add(stock['code'])
+                timeseries_by_code.setdefault(stock['code'], []).append({
+                    'date': date,
                     'open': stock['open'],
                     'high': stock['high'],
                     'low': stock['low'],
@@ -188,7 +225,7 @@ class DataLoader:
                     'volume': stock['volume']
                 })
         
-        return timeseries
+        return timeseries_by_code
 
 
 class StockScreener:
@@ -197,6 +234,12 @@ class StockScreener:
     def __init__(self, trading_days, silent=False):
         self.trading_days = trading_days
         self.all_stocks = self._get_all_stock_codes()
+        # 종목별 시계열과 종가 배열 (단계마다 전체 거래일을 다시 탐색하지 않도록 한 번만 생성)
+        self.timeseries_by_code = DataLoader.build_timeseries_index(trading_days)
+        self.closes_by_code = {
+            code: np.array([t['close'] for t in timeseries], dtype=np.float64)
+            for code, timeseries in self.timeseries_by_code.items()
+        }
         self.silent = silent
     
     def _get_all_stock_codes(self):
@@ -227,12 +270,12 @@ class StockScreener:
             stock_name = stock_info['name']
             
             # 종목 시계열 데이터 추출
-            timeseries = DataLoader.get_stock_timeseries(self.trading_days, stock_code)
+            timeseries = self.timeseries_by_code.get(stock_code, [])
             
             if len(timeseries) < 50:  # 최소 50일 데이터 필요
                 continue
             
-            closes = [t['close'] for t in timeseries]
+            closes = self.closes_by_code[stock_code]
             
             # MACD 계산
             macd_line, signal_line = TechnicalIndicators.calculate_macd(closes)
@@ -277,20 +320,20 @@ class StockScreener:
             macd_gc_index = stock_info['macd_golden_cross_index']
             
             # 종목 시계열 데이터 추출
-            timeseries = DataLoader.get_stock_timeseries(self.trading_days, stock_code)
+            timeseries = self.timeseries_by_code.get(stock_code, [])
             
             if len(timeseries) < 30:
                 continue
             
-            closes = [t['close'] for t in timeseries]
+            closes = self.closes_by_code[stock_code]
             
             # RSI 계산
             rsi_line = TechnicalIndicators.calculate_rsi(closes, 14)
-            rsi_signal = TechnicalIndicators.calculate_ema([r for r in rsi_line if r is not None], 9)
+            valid = ~np.isnan(rsi_line)
             
-            # RSI 시그널 앞부분을 None으로 맞춤
-            none_count = len([r for r in rsi_line if r is None])
-            rsi_signal_aligned = [None] * none_count + rsi_signal
+            # RSI 시그널은 계산 가능한 RSI 구간의 EMA, 앞부분은 NaN으로 맞춤
+            rsi_signal_aligned = np.full(len(rsi_line), np.nan)
+            rsi_signal_aligned[valid] = TechnicalIndicators.calculate_ema(rsi_line[valid], 9)
             
             # MACD 골든 크로스 이전 lookback_days 이내에서 RSI 골든 크로스 찾기
             start_index = max(0, macd_gc_index - lookback_days)
@@ -334,12 +377,12 @@ class StockScreener:
             macd_gc_index = stock_info['macd_golden_cross_index']
             
             # 종목 시계열 데이터 추출
-            timeseries = DataLoader.get_stock_timeseries(self.trading_days, stock_code)
+            timeseries = self.timeseries_by_code.get(stock_code, [])
             
             if len(timeseries) < 25:
                 continue
             
-            closes = [t['close'] for t in timeseries]
+            closes = self.closes_by_code[stock_code]
             lows = [t['low'] for t in timeseries]
             highs = [t['high'] for t in timeseries]
             
@@ -357,11 +400,11 @@ class StockScreener:
             
             if ma_gc_info:
                 # 진입가: MACD 골든 크로스 발생일의 종가
-                entry_price = closes[macd_gc_index]
+                entry_price = float(closes[macd_gc_index])
                 
                 # 현재가 및 이격도 계산
-                current_close = closes[-1]
-                current_ma20 = ma20[-1] if ma20[-1] is not None else current_close
+                current_close = float(closes[-1])
+                current_ma20 = float(ma20[-1]) if not np.isnan(ma20[-1]) else current_close
                 separation_rate = ((current_close - current_ma20) / current_ma20) * 100 if current_ma20 != 0 else 0
                 
                 # 수익률 계산 (진입가 대비 현재가)
@@ -442,17 +485,14 @@ class StockScreener:
     def _find_golden_cross_in_range(self, line1, line2, timeseries, start_index, end_index):
         """지정된 범위에서 골든 크로스 찾기 (역순: 최신 신호 우선)"""
         for i in range(end_index - 1, start_index, -1):
-            if (line1[i] is not None and line2[i] is not None and
-                line1[i-1] is not None and line2[i-1] is not None):
-                
-                # 골든 크로스: line1이 line2를 아래에서 위로 돌파
-                if line1[i-1] <= line2[i-1] and line1[i] > line2[i]:
-                    return {
-                        'date': timeseries[i]['date'],
-                        'index': i,
-                        'value1': round(line1[i], 2),
-                        'value2': round(line2[i], 2)
-                    }
+            # 골든 크로스: line1이 line2를 아래에서 위로 돌파 (NaN이 섞이면 비교 결과가 False)
+            if line1[i-1] <= line2[i-1] and line1[i] > line2[i]:
+                return {
+                    'date': timeseries[i]['date'],
+                    'index': i,
+                    'value1': round(float(line1[i]), 2),
+                    'value2': round(float(line2[i]), 2)
+                }
         
         return None
 
@@ -548,7 +588,7 @@ def save_results(results, start_date, end_date):
     print(f"{'='*60}")
 
 
-def backtest_stocks(results, trading_days, end_date, silent=False):
+def backtest_stocks(results, timeseries_by_code, end_date, silent=False):
     """백테스팅: 익일 시가 매수 후 손절/익절 도달 여부 확인"""
     if not silent:
         print(f"\n{'='*80}")
@@ -565,20 +605,8 @@ def backtest_stocks(results, trading_days, end_date, silent=False):
         stop_loss = stock['stop_loss']
         take_profit = stock['take_profit']
         
-        # 해당 종목의 시계열 데이터 추출
-        stock_data = []
-        for day in trading_days:
-            if day['is_holiday']:
-                continue
-            stock_info = next((s for s in day['stocks'] if s['code'] == stock_code), None)
-            if stock_info:
-                stock_data.append({
-                    'date': day['date'],
-                    'open': stock_info['open'],
-                    'high': stock_info['high'],
-                    'low': stock_info['low'],
-                    'close': stock_info['close']
-                })
+        # 해당 종목의 시계열 데이터 (거래일만 담긴 종목별 인덱스)
+        stock_data = timeseries_by_code.get(stock_code, [])
         
         # MACD 골든 크로스 발생일 찾기
         macd_index = next((i for i, d in enumerate(stock_data) if d['date'] == macd_date), None)
@@ -855,7 +883,7 @@ def main():
     
     # 백테스팅 실행 (옵션이 주어진 경우)
     if args.backtest:
-        backtested_stocks = backtest_stocks(final_stocks, trading_days, end_date, silent=args.silent)
+        backtested_stocks = backtest_stocks(final_stocks, screener.timeseries_by_code, end_date, silent=args.silent)
         
         # 최종 결과 출력 (백테스팅 포함) - silent 모드에서 먼저 표시
         print_final_summary(backtested_stocks, silent=args.silent)
@@ -177,15 +177,23 @@ class DataLoader:
         return filtered_days
     
     @staticmethod
-    def get_stock_timeseries(trading_days, stock_code):
-        """특정 종목의 시계열 데이터 추출"""
-        timeseries = []
+    def build_timeseries_index(trading_days):
+        """전체 거래일을 한 번 순회해 종목코드별 시계열 데이터 생성
+        
+        종목마다 모든 거래일의 종목 목록을 선형 탐색하지 않도록 {종목코드: 시계열 리스트}로 모아
+        종목 검색과 백테스팅에서 함께 사용한다.
+        """
+        timeseries_by_code = {}
         
         for day in trading_days:
-            stock = next((s for s in day['stocks'] if s['code'] == stock_code), None)
-            if stock:
-                timeseries.append({
-                    'date': day['date'],
+            date = day['date']
+            seen = set()
+            for stock in day['stocks']:
+                if stock['code'] in seen:
+                    continue  # 같은 날 중복 항목은 첫 번째만 사용
+                seen.add(stock['code'])
+                timeseries_by_code.setdefault(stock['code'], []).append({
+                    'date': date,
                     'open': stock['open'],
                     'high': stock['high'],
                     'low': stock['low'],
@@ -193,7 +201,7 @@ class DataLoader:
                     'volume': stock['volume']
                 })
         
-        return timeseries
+        return timeseries_by_code
 
 
 class StockScreener:
@@ -202,6 +210,8 @@ class StockScreener:
     def __init__(self, trading_days, silent=False):
         self.trading_days = trading_days
         self.all_stocks = self._get_all_stock_codes()
+        # 종목별 시계열 (종목 검색과 백테스팅에서 재사용하도록 한 번만 생성)
+        self.timeseries_by_code = DataLoader.build_timeseries_index(trading_days)
         self.silent = silent
     
     def _get_all_stock_codes(self):
@@ -242,7 +252,7 @@ class StockScreener:
             stock_code = stock_info['code']
             stock_name = stock_info['name']
             
-            timeseries = DataLoader.get_stock_timeseries(self.trading_days, stock_code)
+            timeseries = self.timeseries_by_code.get(stock_code, [])
             
             # 디버그: 첫 번째 종목의 timeseries 길이 확인
             if debug and idx == 1:
@@ -607,7 +617,7 @@ def save_results(results, start_date, end_date):
     print(f"{'='*60}")
 
 
-def backtest_stocks(results, trading_days, end_date, silent=False, timeout_days=30):
+def backtest_stocks(results, timeseries_by_code, end_date, silent=False, timeout_days=30):
     """백테스팅: 익일 시가 매수 후 손절/익절 확인"""
     if not silent:
         print(f"\n{'='*80}")
@@ -621,7 +631,7 @@ def backtest_stocks(results, trading_days, end_date, silent=False, timeout_days=
         signal_idx = stock['signal_index']
         
         # 해당 종목의 전체 시계열 데이터 가져오기
-        timeseries = DataLoader.get_stock_timeseries(trading_days, stock_code)
+        timeseries = timeseries_by_code.get(stock_code, [])
         
         if signal_idx + 1 >= len(timeseries):
             continue
@@ -851,7 +861,7 @@ def main():
     if args.backtest:
         backtested_stocks = backtest_stocks(
             selected_stocks, 
-            trading_days, 
+            screener.timeseries_by_code, 
             end_date, 
             silent=args.silent,
             timeout_days=args.low_period